@@ -1,17 +1,41 @@
-"""Resonance Ionization Mass Spectrometry (RIMS) Data Evaluation for CRD Files."""
+"""Resonance Ionization Mass Spectrometry (RIMS) Data Evaluation for CRD Files.
 
-import iniabu
+Submodules and classes are only imported when they are first accessed, such that
+``import rimseval`` does not pull in the GUIs (Qt) or other heavy dependencies. The
+``iniabu`` database behind ``rimseval.ini`` is also only loaded on first access.
+"""
 
-from . import data_io
-from . import guis
-from . import interfacer
-from . import utilities
-from .multi_proc import MultiFileProcessor
-from .processor import CRDFileProcessor
+import importlib
+from typing import TYPE_CHECKING, Any, List
+
+if TYPE_CHECKING:  # pragma: nocover
+    from . import data_io
+    from . import guis
+    from . import interfacer
+    from . import utilities
+    from .multi_proc import MultiFileProcessor
+    from .processor import CRDFileProcessor
+    from .utilities import ini
 
 VERBOSITY = 0
 
-ini = iniabu.IniAbu(database="nist")
+# submodules that are imported on first access
+_LAZY_SUBMODULES = (
+    "compatibility",
+    "data_io",
+    "guis",
+    "interfacer",
+    "multi_proc",
+    "processor",
+    "processor_utils",
+    "utilities",
+)
+
+# classes that are imported on first access, name: submodule
+_LAZY_ATTRIBUTES = {
+    "CRDFileProcessor": "processor",
+    "MultiFileProcessor": "multi_proc",
+}
 
 __all__ = [
     "VERBOSITY",
@@ -23,3 +47,33 @@ __all__ = [
     "MultiFileProcessor",
     "utilities",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    """Import submodules and classes on first access.
+
+    :param name: Name of the attribute.
+
+    :return: The requested submodule or class.
+
+    :raises AttributeError: Attribute does not exist.
+    """
+    if name in _LAZY_SUBMODULES:
+        return importlib.import_module(f".{name}", __name__)
+    if name == "ini":  # share the iniabu instance (NIST database) of the utilities
+        from .utilities import ini
+
+        globals()["ini"] = ini
+        return ini
+    if name in _LAZY_ATTRIBUTES:
+        submodule = importlib.import_module(f".{_LAZY_ATTRIBUTES[name]}", __name__)
+        value = getattr(submodule, name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__() -> List[str]:
+    """Return all attributes, including the ones that are not imported yet."""
+    lazy_names = set(_LAZY_SUBMODULES) | set(_LAZY_ATTRIBUTES) | {"ini"}
+    return sorted(set(globals()) | lazy_names)
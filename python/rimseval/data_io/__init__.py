@@ -4,11 +4,38 @@ This routine turns list files into crd files. The crd file format is as specifie
 the `docs` folder and adheres currently to v1.0 of the format.
 """
 
+import importlib
+from typing import TYPE_CHECKING, Any, List
+
 from . import crd_utils
-from . import export
-from . import integrals
 from . import lst_utils
 from .crd_reader import CRDReader
 from .lst_to_crd import LST2CRD
 
+if TYPE_CHECKING:  # pragma: nocover
+    from . import export
+    from . import integrals
+
+# submodules that depend on the processor, imported on first access
+_LAZY_SUBMODULES = ("excel_writer", "export", "integrals")
+
 __all__ = ["export", "crd_utils", "integrals", "lst_utils", "CRDReader", "LST2CRD"]
+
+
+def __getattr__(name: str) -> Any:
+    """Import submodules on first access.
+
+    :param name: Name of the attribute.
+
+    :return: The requested submodule.
+
+    :raises AttributeError: Attribute does not exist.
+    """
+    if name in _LAZY_SUBMODULES:
+        return importlib.import_module(f".{name}", __name__)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__() -> List[str]:
+    """Return all attributes, including the ones that are not imported yet."""
+    return sorted(set(globals()) | set(_LAZY_SUBMODULES))
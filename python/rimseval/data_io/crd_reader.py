@@ -1,14 +1,17 @@
 """CRD reader to handle any kind of header and version (currently v1)."""
 
 from pathlib import Path
-import struct
-from typing import Tuple
+from typing import Tuple, Union
 import warnings
+from weakref import WeakValueDictionary
 
 import numpy as np
 
 from . import crd_utils
 
+# readers that are alive, keyed by resolved path, modification time and file size
+_CRD_CACHE = WeakValueDictionary()
+
 
 class CRDReader:
     """Read CRD Files and make the data available.
@@ -20,17 +23,41 @@ class CRDReader:
         13281
         >>> crd_file.nof_shots
         5000
+
+    Opening a file that is already open in another reader and has not been modified
+    since returns the same reader without parsing the file again. The data of a
+    reader must therefore not be modified in place.
     """
 
-    def __init__(self, fname: Path) -> None:
+    def __new__(cls, fname: Path, cache: bool = False) -> "CRDReader":
+        """Return the reader of this file if one is alive, otherwise a new one.
+
+        :param fname: Filename
+        :param cache: Passed on to ``__init__``.
+
+        :return: Reader for the given file.
+        """
+        key = _cache_key(fname)
+        if key is not None:
+            reader = _CRD_CACHE.get(key)
+            if reader is not None:
+                return reader
+        return super().__new__(cls)
+
+    def __init__(self, fname: Path, cache: bool = False) -> None:
         """Read in a CRD file and make all header arguments available.
 
         :param fname: Filename
+        :param cache: Store the parsed file next to the CRD file (same name with
+            ``.npz`` appended) and load it from there the next time, as long as the
+            CRD file has not been modified since. Defaults to ``False``.
 
         :raises TypeError: Fname must be a valid path.
         """
         if not isinstance(fname, Path):
             raise TypeError("Filename must be given as a valid Path using pathlib.")
+        if getattr(self, "_parsed", False):  # shared reader, already parsed
+            return
         self.fname = fname
 
         # header dictionary
@@ -49,7 +76,16 @@ class CRDReader:
         self.eof = False
 
         # now read the stuff
-        self.read_data()
+        cache_fname = fname.with_name(f"{fname.name}.npz") if cache else None
+        if cache_fname is None or not self._read_cache(cache_fname):
+            self.read_data()
+            if cache_fname is not None:
+                self._write_cache(cache_fname)
+
+        self._parsed = True
+        key = _cache_key(fname)
+        if key is not None:
+            _CRD_CACHE[key] = self
 
     @property
     def all_data(self) -> Tuple[np.ndarray, np.ndarray]:
@@ -101,14 +137,15 @@ class CRDReader:
 
     # FUNCTIONS #
 
-    def parse_data(self, data: bytes) -> None:
+    def parse_data(self, data: Union[bytes, np.ndarray]) -> None:
         """Parse the actual data out and put into the appropriate array.
 
         For this parsing to work, everything has to be just right, i.e., the number
         of shots have to be exactly defined and the data should have the right length.
         If not, this needs to throw a warning and move on to parse in a slower way.
 
-        :param data: Binary string of all the data according to CRD specification.
+        :param data: Binary data according to CRD specification, e.g., as bytes or as
+            a memory mapped array.
 
         :warning: Number of Shots do not agree with the number of shots in the list or
             certain ions are outside the binRange. Fallback to slower reading routine.
@@ -117,36 +154,14 @@ class CRDReader:
         nof_shots = self.header["nofShots"]
         self._nof_shots = nof_shots
 
-        ions_per_shot = np.zeros(nof_shots, dtype=np.int32)
+        words = np.frombuffer(data, dtype="<u4")
         # calculate number of ions from filesize
-        nof_ions = len(data) // 4 - nof_shots
+        nof_ions = words.shape[0] - nof_shots
         self._nof_ions = nof_ions
-        all_tofs = np.zeros(nof_ions, dtype=np.int32)
-
-        # loop through the data
-        shot_ind = 0  # index in ions_per_shot array
-        all_tof_ind = 0  # index in all_tofs array
-        bin_ind = 0  # index in binary file
-        warning_occured = False  # bool if we had a warning and need to take it slow
-        while shot_ind < nof_shots:
-            # ions in the given shot
-            curr_ions_in_shot = struct.unpack("<I", data[bin_ind : bin_ind + 4])[0]
-            ions_per_shot[shot_ind] = curr_ions_in_shot
-            # now write out the times
-            for _ in range(curr_ions_in_shot):
-                try:
-                    bin_ind += 4
-                    curr_time_bin = struct.unpack("<I", data[bin_ind : bin_ind + 4])[0]
-                    all_tofs[all_tof_ind] = curr_time_bin
-                    all_tof_ind += 1
-                except IndexError:
-                    warning_occured = True
-                    shot_ind = nof_shots  # to break out of while loop
-                    break
-            bin_ind += 4
-            shot_ind += 1
-
-        if warning_occured or bin_ind != len(data):
+
+        shot_indexes, end_index = crd_utils.find_shot_headers(words, nof_shots)
+
+        if shot_indexes.shape[0] != nof_shots or end_index != words.shape[0]:
             warnings.warn(
                 f"This CRD file does not adhere to the specifications and might be "
                 f"corrupt. I will try a slow reading routine now in order to get the "
@@ -159,35 +174,27 @@ class CRDReader:
             self.parse_data_fallback(data)
             return
         else:
-            self._ions_per_shot = ions_per_shot
-            self._all_tofs = all_tofs
+            tof_mask = np.ones(words.shape[0], dtype=bool)
+            tof_mask[shot_indexes] = False
+            self._ions_per_shot = words[shot_indexes].astype(np.int32)
+            self._all_tofs = words[tof_mask].astype(np.int32)
 
-    def parse_data_fallback(self, data: bytes) -> None:
-        """Slow reading routine in case the CRD file is corrupt.
+    def parse_data_fallback(self, data: Union[bytes, np.ndarray]) -> None:
+        """Fallback reading routine in case the CRD file is corrupt.
 
-        Here we don't assume anything and just try to read the data into lists and
-        append them. Sure, this is going to be slow, but better than no data at all.
+        Here we don't assume anything about the number of shots and just walk through
+        the data until it ends. If the last shot is incomplete, only the ions that are
+        present are kept.
 
         :param data: Array of all the data.
         """
-        ions_per_shot = []
-        all_tofs = []
-
-        bin_ind = 0  # index inside of binary `data`
-        while bin_ind < len(data):
-            curr_ions_in_shot = struct.unpack("<I", data[bin_ind : bin_ind + 4])[0]
-            ions_per_shot.append(curr_ions_in_shot)
-            # now append the times
-            for _ in range(curr_ions_in_shot):
-                bin_ind += 4
-                curr_time_bin = struct.unpack("<I", data[bin_ind : bin_ind + 4])[0]
-                all_tofs.append(curr_time_bin)
-            bin_ind += 4
+        words = np.frombuffer(data, dtype="<u4")
+        ions_per_shot, all_tofs = crd_utils.parse_data_fallback(words)
 
         self._nof_shots = len(ions_per_shot)
-        self._ions_per_shot = np.array(ions_per_shot)
+        self._ions_per_shot = ions_per_shot
         self._nof_ions = len(all_tofs)
-        self._all_tofs = np.array(all_tofs)
+        self._all_tofs = all_tofs
 
     def read_data(self) -> None:
         """Read in the data and parse out the header.
@@ -198,41 +205,118 @@ class CRDReader:
         :raises KeyError: Header is not available.
         :raises OSError: Corrupt data length.
         """
-        with open(self.fname, "rb") as f_in:
-            # read start of the header
-            for name, size, fmt in crd_utils.HEADER_START:
-                self.header[name] = struct.unpack(fmt, f_in.read(size))[0]
-
-            # get the rest of the header
-            crd_version = f"v{self.header['majVer']}p{self.header['minVer']}"
-            try:
-                hdr_description = crd_utils.CRDHeader[crd_version].value
-            except KeyError as exc:
-                raise KeyError(
-                    f"The header version of this CRD file is {crd_version}, "
-                    f"which is not available."
-                ) from exc
-
-            for name, size, fmt in hdr_description:
-                self.header[name] = struct.unpack(fmt, f_in.read(size))[0]
-
-            # now read in the rest of the file
-            rest = f_in.read()
+        # map the file into memory, data are only read when accessed
+        content = np.memmap(self.fname, dtype=np.uint8, mode="r")
+
+        # read start of the header
+        hdr_start_dtype = crd_utils.HEADER_START_DTYPE
+        offset = hdr_start_dtype.itemsize
+        self.header.update(
+            crd_utils.unpack_header(content[:offset], hdr_start_dtype)
+        )
+
+        # get the rest of the header
+        crd_version = f"v{self.header['majVer']}p{self.header['minVer']}"
+        try:
+            hdr_dtype = crd_utils.HEADER_DTYPES[crd_version]
+        except KeyError as exc:
+            raise KeyError(
+                f"The header version of this CRD file is {crd_version}, "
+                f"which is not available."
+            ) from exc
+
+        self.header.update(
+            crd_utils.unpack_header(
+                content[offset : offset + hdr_dtype.itemsize], hdr_dtype
+            )
+        )
+        offset += hdr_dtype.itemsize
+
+        # the rest of the file are the data
+        rest = content[offset:]
 
         if len(rest) % 4 != 0:
             raise OSError(
                 "Data length does not agree with CRD format and seems to be corrupt."
             )
 
-        # check for eof
-        if struct.unpack("4s", rest[-4:])[0][:-1] == b"OK!":
-            self.eof = True
-
-        # prepare the data
-        if self.eof:
-            self.parse_data(rest[:-4])
-        else:
-            self.parse_data(rest)
+        # check for eof and parse the data without it
+        self.eof = rest[-4:-1].tobytes() == b"OK!"
+        self.parse_data(rest[: len(rest) - 4 * self.eof])
 
         # now call the mapper routine
         self._ions_to_tof_map = crd_utils.shot_to_tof_mapper(self._ions_per_shot)
+
+    # PRIVATE ROUTINES #
+
+    def _read_cache(self, cache_fname: Path) -> bool:
+        """Read the header and data from a cache file, if it is up to date.
+
+        :param cache_fname: File name of the cache.
+
+        :return: Was the cache read successfully?
+        """
+        try:
+            if cache_fname.stat().st_mtime < self.fname.stat().st_mtime:
+                return False
+            with np.load(cache_fname, allow_pickle=False) as cache:
+                header = {
+                    key[4:]: cache[key].item()
+                    for key in cache.files
+                    if key.startswith("hdr_")
+                }
+                ions_per_shot = cache["ions_per_shot"]
+                all_tofs = cache["all_tofs"]
+                eof = bool(cache["eof"])
+        except (OSError, KeyError, ValueError):
+            return False
+
+        self.header = header
+        self.eof = eof
+        self._ions_per_shot = ions_per_shot
+        self._all_tofs = all_tofs
+        self._nof_shots = len(ions_per_shot)
+        self._nof_ions = len(all_tofs)
+        self._ions_to_tof_map = crd_utils.shot_to_tof_mapper(ions_per_shot)
+        return True
+
+    def _write_cache(self, cache_fname: Path) -> None:
+        """Write the header and the data to a cache file.
+
+        Strings in the header are stored as raw bytes to keep their padding. If the
+        cache cannot be written, e.g., since the folder is read-only, nothing is done.
+
+        :param cache_fname: File name of the cache.
+        """
+        header = {
+            f"hdr_{key}": np.void(val) if isinstance(val, bytes) else np.array(val)
+            for key, val in self.header.items()
+        }
+        try:
+            with cache_fname.open("wb") as fout:
+                np.savez(
+                    fout,
+                    ions_per_shot=self._ions_per_shot,
+                    all_tofs=self._all_tofs,
+                    eof=np.array(self.eof),
+                    **header,
+                )
+        except OSError:
+            return
+
+
+def _cache_key(fname: Path) -> Union[Tuple[Path, int, int], None]:
+    """Create the key for the reader cache of a given file.
+
+    :param fname: Filename
+
+    :return: Resolved path, modification time in ns, and size of the file. ``None``
+        if the file cannot be accessed.
+    """
+    if not isinstance(fname, Path):
+        return None
+    try:
+        stat = fname.stat()
+        return fname.resolve(), stat.st_mtime_ns, stat.st_size
+    except OSError:
+        return None
@@ -2,11 +2,12 @@
 
 from enum import Enum
 import struct
+from typing import Tuple
 
 from numba import njit
 import numpy as np
 
-# current default CRD header information, packed and ready to be written
+# current default CRD header information, packed (little-endian) and ready to be written
 CURRENT_DEFAULTS = {
     "fileID": struct.pack("4s", bytes("CRD", "utf-8")),
     "minVer": struct.pack("<H", 0),
@@ -61,7 +62,102 @@ class CRDHeader(Enum):
     )
 
 
-@njit
+def _header_dtype(hdr_description: Tuple[Tuple[str, int, str], ...]) -> np.dtype:
+    """Create a structured numpy data type for a given header description.
+
+    Strings are read as raw bytes, such that padding null bytes are kept the same way
+    as when reading them with ``struct.unpack``.
+
+    :param hdr_description: Header description, tuples of name, length, struct format.
+
+    :return: Structured data type to read the header with.
+    """
+    return np.dtype(
+        [
+            (name, f"V{size}" if fmt.endswith("s") else fmt)
+            for name, size, fmt in hdr_description
+        ]
+    )
+
+
+# structured data types to read the start of the header and the versioned rest with
+HEADER_START_DTYPE = _header_dtype(HEADER_START)
+HEADER_DTYPES = {hdr.name: _header_dtype(hdr.value) for hdr in CRDHeader}
+
+
+def unpack_header(data: bytes, dtype: np.dtype) -> dict:
+    """Unpack (part of) a CRD header into a dictionary.
+
+    :param data: Binary header data, must be exactly as long as the data type.
+    :param dtype: Structured data type that describes the header.
+
+    :return: Dictionary with name and value of each header field.
+    """
+    hdr = np.frombuffer(data, dtype=dtype, count=1)[0]
+    return dict(zip(dtype.names, hdr.item()))  # noqa: B905
+
+
+@njit(cache=True, nogil=True)
+def find_shot_headers(
+    words: np.ndarray, nof_shots: int
+) -> Tuple[np.ndarray, int]:  # pragma: nocover
+    """Find the positions of the ions per shot entries in the CRD data block.
+
+    The data block contains, for every shot, one word with the number of ions in that
+    shot, followed by one word per ion with its arrival bin. Finding the shot entries
+    requires walking through the block, the rest of the decoding can then be done
+    with numpy indexing.
+
+    :param words: Data block of the CRD file as a 1D array of 4 byte words.
+    :param nof_shots: Number of shots to look for.
+
+    :return: Indexes of the shot entries in ``words`` (shorter than ``nof_shots`` if the
+        data block ends early), index in ``words`` at which the last shot ends.
+    """
+    indexes = np.empty(nof_shots, dtype=np.int64)
+    cursor = 0
+    shot = 0
+    while shot < nof_shots and cursor < words.shape[0]:
+        indexes[shot] = cursor
+        cursor += words[cursor] + 1
+        shot += 1
+    return indexes[:shot], cursor
+
+
+@njit(cache=True, nogil=True)
+def parse_data_fallback(
+    words: np.ndarray,
+) -> Tuple[np.ndarray, np.ndarray]:  # pragma: nocover
+    """Parse a CRD data block without relying on the header.
+
+    Walks through the data block shot by shot until the data ends, independent of
+    the number of shots given in the header. If the last shot claims more ions than
+    there is data left, it is truncated to the ions that are available.
+
+    :param words: Data block of the CRD file as a 1D array of 4 byte words.
+
+    :return: Ions per shot, arrival bins of all ions.
+    """
+    ions_per_shot = np.empty(words.shape[0], dtype=np.int64)
+    all_tofs = np.empty(words.shape[0], dtype=np.int64)
+
+    nof_shots = 0
+    nof_ions = 0
+    cursor = 0
+    while cursor < words.shape[0]:
+        ions_in_shot = min(int(words[cursor]), words.shape[0] - cursor - 1)
+        ions_per_shot[nof_shots] = ions_in_shot
+        all_tofs[nof_ions : nof_ions + ions_in_shot] = words[
+            cursor + 1 : cursor + 1 + ions_in_shot
+        ]
+        nof_shots += 1
+        nof_ions += ions_in_shot
+        cursor += ions_in_shot + 1
+
+    return ions_per_shot[:nof_shots], all_tofs[:nof_ions]
+
+
+@njit(cache=True, nogil=True)
 def shot_to_tof_mapper(ions_per_shot: np.array) -> np.array:  # pragma: nocover
     """Mapper for ions_to_shot to all_tofs.
 
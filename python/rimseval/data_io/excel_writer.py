@@ -1,6 +1,6 @@
 """Write Excel Files from the files that we have, e.g., a workup file."""
 
-from datetime import datetime
+from datetime import date
 from pathlib import Path
 
 from iniabu.utilities import item_formatter
@@ -19,6 +19,10 @@ def workup_file_writer(
     This is for the user to write out an excel workup file, which will already be
     filled with the integrals of the given CRD file.
 
+    The workbook is written in constant memory mode: Every row is flushed to disk once
+    the next row is started, hence rows must be written in ascending order and cannot
+    be edited afterwards.
+
     :param crd: CRD file processor file to write out.
     :param fname: File name for the file to write out to.
     :param timestamp: Create a column for the time stamp? Defaults to ``False``
@@ -45,10 +49,11 @@ def workup_file_writer(
 
     fname = fname.with_suffix(".xlsx").absolute()  # ensure correct format
 
-    wb = xlsxwriter.Workbook(str(fname))
+    # rows are written to disk as soon as the next row is started
+    wb = xlsxwriter.Workbook(str(fname), {"constant_memory": True})
     ws = wb.add_worksheet()
 
-    # formats
+    # formats, all defined once here and shared by the cells that use them
     fmt_title = wb.add_format({"bold": True, "font_size": 14})
     fmt_hdr_0 = wb.add_format({"bold": True, "italic": True, "left": True})
     fmt_hdr = wb.add_format({"bold": True, "italic": True})
@@ -85,7 +90,7 @@ def workup_file_writer(
         general_headers_widths.append(18)
 
     # write the title
-    ws.write(0, 0, f"Workup {datetime.today().date()}", fmt_title)
+    ws.write(0, 0, f"Workup {date.today()}", fmt_title)
 
     # write data header and abundances
     hdr_row = abu_row + 1  # row to start header of the data in
@@ -93,18 +98,19 @@ def workup_file_writer(
     int_col = len(general_headers)  # start of integral column
     delta_col = int_col + 2 * len(int_names)  # start of delta column
 
-    for col, hdr in enumerate(general_headers):
-        ws.write(hdr_row, col, hdr, fmt_hdr)
-        ws.set_column(col, col, general_headers_widths[col])
-
-    for col, name in enumerate(int_names):
-        # write abundances
+    # rows must be written in ascending order (constant memory mode)
+    for col, name in enumerate(int_names):  # abundances
         try:
             abu_col = ini.iso[name].abu_rel
             ws.write(abu_row, 2 * col + int_col, abu_col, fmt_std_abus)
         except IndexError:
             pass
-        # write integral header
+
+    ws.write_row(hdr_row, 0, general_headers, fmt_hdr)
+    for col, width in enumerate(general_headers_widths):
+        ws.set_column(col, col, width)
+
+    for col, name in enumerate(int_names):  # integral header
         name = iso_format_excel(name)
 
         fmt_hdr_use = fmt_hdr_0 if col == 0 else fmt_hdr
@@ -115,12 +121,19 @@ def workup_file_writer(
     # integral column width
     ws.set_column(int_col, int_col + 2 * len(int_names) - 1, wdth_counts)
 
+    # index of each integral name (first occurrence) to look up normalizing isotopes
+    int_indexes = {}
+    for it, name in enumerate(int_names):
+        int_indexes.setdefault(name, it)
+
+    # integrals with a valid normalizing isotope, their delta column and norm index
+    delta_defs = []
     col = delta_col
     for it, name in enumerate(int_names):
         norm_iso_name = norm_names[it]
         fmt_hdr_use = fmt_hdr_0 if col == delta_col else fmt_hdr
         if (
-            norm_iso_name is not None and norm_iso_name in int_names
+            norm_iso_name is not None and norm_iso_name in int_indexes
         ):  # norm isotope valid
             ws.write(
                 hdr_row,
@@ -134,94 +147,78 @@ def workup_file_writer(
             ws.set_column(col, col, wdth_delta)
             ws.set_column(col + 1, col + 1, wdth_delta_unc)
 
+            delta_defs.append((it, col, int_indexes[norm_iso_name]))
             col += 2
 
     # WRITE DATA
     data_row = hdr_row + 1
 
-    # file name
-    ws.write(data_row, fname_col, crd.fname.name)
-
-    # write the number of shots
-    ws.write(data_row, shots_col, crd.nof_shots, fmt_counts)
-
-    for row in range(data_row + 1, num_eqn_rows + data_row):
-        ws.write_blank(row, shots_col, None, fmt_counts)
-
-    # write the timestamp if requested
-    if timestamp:
-        ws.write(data_row, shots_col + 1, crd.timestamp, fmt_timestamp)
-
-    for row in range(data_row + 1, num_eqn_rows + data_row):
-        ws.write_blank(row, shots_col + 1, None, fmt_timestamp)
-
-    # write integrals
-    for col, dat in enumerate(crd.integrals):
-        fmt_counts_use = fmt_counts_0 if col == 0 else fmt_counts
-        ws.write(data_row, 2 * col + int_col, dat[0], fmt_counts_use)
-        ws.write(data_row, 2 * col + int_col + 1, dat[1], fmt_counts_unc)
+    for eq_row in range(num_eqn_rows):
+        row = data_row + eq_row
+
+        if eq_row == 0:
+            # file name
+            ws.write(row, fname_col, crd.fname.name)
+
+            # write the number of shots
+            ws.write(row, shots_col, crd.nof_shots, fmt_counts)
+
+            # write the timestamp if requested
+            if timestamp:
+                ws.write(row, shots_col + 1, crd.timestamp, fmt_timestamp)
+
+            # write integrals
+            for col, dat in enumerate(crd.integrals):
+                fmt_counts_use = fmt_counts_0 if col == 0 else fmt_counts
+                ws.write(row, 2 * col + int_col, dat[0], fmt_counts_use)
+                ws.write(row, 2 * col + int_col + 1, dat[1], fmt_counts_unc)
+        else:
+            ws.write_blank(row, shots_col, None, fmt_counts)
+            if timestamp:
+                ws.write_blank(row, shots_col + 1, None, fmt_timestamp)
+
+            for col, _ in enumerate(crd.integrals):  # boarder for integrals
+                fmt_counts_use = fmt_counts_0 if col == 0 else fmt_counts
+                ws.write_blank(row, 2 * col + int_col, None, fmt_counts_use)
+                ws.write_blank(row, 2 * col + int_col + 1, None, fmt_counts_unc)
+
+        # write delta equations
+        for it, col, norm_it in delta_defs:
+            # get cell values, nominators and denominators
+            nom_iso = xl_rowcol_to_cell(row, 2 * it + int_col)
+            nom_iso_unc = xl_rowcol_to_cell(row, 2 * it + int_col + 1)
+            den_iso = xl_rowcol_to_cell(row, 2 * norm_it + int_col, col_abs=True)
+            den_iso_unc = xl_rowcol_to_cell(
+                row, 2 * norm_it + int_col + 1, col_abs=True
+            )
+            # get standard abundances cell names
+            nom_std = xl_rowcol_to_cell(abu_row, 2 * it + int_col, row_abs=True)
+            den_std = xl_rowcol_to_cell(
+                abu_row, 2 * norm_it + int_col, row_abs=True, col_abs=True
+            )
 
-    for row in range(data_row + 1, num_eqn_rows + data_row):  # boarder for integrals
-        for col, _ in enumerate(crd.integrals):
-            fmt_counts_use = fmt_counts_0 if col == 0 else fmt_counts
-            ws.write_blank(row, 2 * col + int_col, None, fmt_counts_use)
-            ws.write_blank(row, 2 * col + int_col + 1, None, fmt_counts_unc)
+            # decide if we write a boarder or not
+            fmt_delta_use = fmt_delta_0 if col == delta_col else fmt_delta
 
-    # write delta equations
-    col = delta_col
-    for it, _ in enumerate(int_names):
-        norm_iso_name = norm_names[it]
-        if (
-            norm_iso_name is not None and norm_iso_name in int_names
-        ):  # norm isotope valid
-            for eq_row in range(num_eqn_rows):
-                # get cell values, nominators and denominators
-                nom_iso = xl_rowcol_to_cell(data_row + eq_row, 2 * it + int_col)
-                nom_iso_unc = xl_rowcol_to_cell(data_row + eq_row, 2 * it + int_col + 1)
-                den_iso = xl_rowcol_to_cell(
-                    data_row + eq_row,
-                    2 * int_names.index(norm_iso_name) + int_col,
-                    col_abs=True,
-                )
-                den_iso_unc = xl_rowcol_to_cell(
-                    data_row + eq_row,
-                    2 * int_names.index(norm_iso_name) + int_col + 1,
-                    col_abs=True,
-                )
-                # get standard abundances cell names
-                nom_std = xl_rowcol_to_cell(abu_row, 2 * it + int_col, row_abs=True)
-                den_std = xl_rowcol_to_cell(
-                    abu_row,
-                    2 * int_names.index(norm_iso_name) + int_col,
-                    row_abs=True,
-                    col_abs=True,
-                )
-
-                # decide if we write a boarder or not
-                fmt_delta_use = fmt_delta_0 if col == delta_col else fmt_delta
-
-                # write the values for the delta formula
-                ws.write(
-                    data_row + eq_row,
-                    col,
-                    f'=IF({nom_iso}<>"",'
-                    f'(({nom_iso}/{den_iso})/({nom_std}/{den_std})-1)*1000, "")',
-                    fmt_delta_use,
-                )
-                # equation for uncertainty
-                ws.write(
-                    data_row + eq_row,
-                    col + 1,
-                    f'=IF({nom_iso}<>"",'
-                    f"1000*SQRT("
-                    f"(({nom_iso_unc}/{den_iso})/({nom_std}/{den_std}))^2+"
-                    f"(({nom_iso}*{den_iso_unc}/{den_iso}^2)/({nom_std}/{den_std}))^2"
-                    f'), "")',
-                    fmt_delta_unc,
-                )
-
-            # increment column
-            col += 2
+            # write the values for the delta formula
+            ws.write(
+                row,
+                col,
+                f'=IF({nom_iso}<>"",'
+                f'(({nom_iso}/{den_iso})/({nom_std}/{den_std})-1)*1000, "")',
+                fmt_delta_use,
+            )
+            # equation for uncertainty
+            ws.write(
+                row,
+                col + 1,
+                f'=IF({nom_iso}<>"",'
+                f"1000*SQRT("
+                f"(({nom_iso_unc}/{den_iso})/({nom_std}/{den_std}))^2+"
+                f"(({nom_iso}*{den_iso_unc}/{den_iso}^2)/({nom_std}/{den_std}))^2"
+                f'), "")',
+                fmt_delta_unc,
+            )
 
     # close the workbook
     wb.close()
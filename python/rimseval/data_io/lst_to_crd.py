@@ -2,6 +2,7 @@
 
 from datetime import datetime
 from enum import Enum
+import operator
 from pathlib import Path
 import struct
 import warnings
@@ -11,6 +12,11 @@ import numpy as np
 from . import crd_utils
 from . import lst_utils
 
+# packers for the header entries that are not in the CRD defaults
+_PACK_DATETIME = struct.Struct("20s")
+_PACK_BINS = struct.Struct("<III")  # bin length, bin start, bin end
+_PACK_U32 = struct.Struct("<I")
+
 
 class LST2CRD:
     """Convert list files to CRD files.
@@ -51,6 +57,23 @@ class LST2CRD:
         ASC_1A = (48, ((0, 16), (16, 44), (45, 48)))
         ASC_9 = (64, ((1, 21), (21, 59), (60, 64)))
 
+        @property
+        def binary_width(self) -> int:
+            """Get the width of the binary number.
+
+            :return: Width of the binary number in bits.
+            """
+            return self.value[0]
+
+        @property
+        def sweep_bits(self) -> int:
+            """Get the number of bits that encode the sweep.
+
+            :return: Width of the sweep in bits.
+            """
+            start, stop = self.value[1][0]
+            return stop - start
+
     class DATFormat(Enum):
         """Available formats (time_patch) for binary data.
 
@@ -102,9 +125,7 @@ class LST2CRD:
 
     @channel_data.setter
     def channel_data(self, newval: int) -> None:
-        if not isinstance(newval, int):
-            raise TypeError("Channel number must be given as an integer.")
-        self._channel_data = newval
+        self._channel_data = _channel_number(newval)
 
     @property
     def channel_tag(self) -> int:
@@ -118,9 +139,7 @@ class LST2CRD:
 
     @channel_tag.setter
     def channel_tag(self, newval):
-        if not isinstance(newval, int):
-            raise TypeError("Channel number must be given as an integer.")
-        self._channel_tag = newval
+        self._channel_tag = _channel_number(newval)
 
     @property
     def data_format(self) -> ASCIIFormat:
@@ -128,7 +147,7 @@ class LST2CRD:
 
         :return: The currently chosen data format.
 
-        :raises TypeError: Data format is not a DataFormat enum.
+        :raises TypeError: Data format is not an ASCIIFormat enum.
         """  # noqa: DAR402
         return self._data_format
 
@@ -137,7 +156,7 @@ class LST2CRD:
         if not isinstance(newval, self.ASCIIFormat):
             raise TypeError(
                 f"Your data format {newval} is not a valid type. "
-                f"You must choose an object from the `DataFormat` instance."
+                f"You must choose an object from the `ASCIIFormat` instance."
             )
         self._data_format = newval
 
@@ -180,6 +199,8 @@ class LST2CRD:
 
         :raises ValueError: File name not provided.
         :raises ValueError: Channel for data not provided.
+        :raises OSError: The data block could not be found in file.
+        :raises OSError: The calibration factor could not be found in file.
         :raises OSError: The Data Format is not available / could not be found in file.
         :raises NotImplementedError: The current data format is not (yet) implemented.
         """
@@ -188,27 +209,36 @@ class LST2CRD:
         if self.channel_data is None:
             raise ValueError("Please set a number for the data channel.")
 
-        # read in the file
-        try:
-            with self.file_name.open() as f:
-                content = f.read().splitlines()
-        except UnicodeDecodeError:  # we might have a binary file:
-            with self.file_name.open("rb") as f:
-                content = f.read().splitlines()
-                self._binary_file = True
-
-        # find the data and save it into a data_ascii list
-        fnd_str = b"[DATA]" if self._binary_file else "[DATA]"
-        index_start_data = content.index(fnd_str) + 1
-        header = content[:index_start_data]
-        if self._binary_file:
-            header = [it.decode("utf-8") for it in header]
-        data_ascii = content[index_start_data:]
+        # read the header (text) and map the data into memory, which might be binary
+        header = []
+        with self.file_name.open("rb") as fin:
+            for line in fin:
+                header.append(line.decode("utf-8").rstrip("\r\n"))
+                if header[-1] == "[DATA]":
+                    break
+            else:
+                raise OSError("Could not find the data block in the list file!")
+            index_start_data = fin.tell()
+
+        if index_start_data < self.file_name.stat().st_size:
+            data = np.memmap(
+                self.file_name, dtype=np.uint8, mode="r", offset=index_start_data
+            )
+        else:  # empty files cannot be mapped
+            data = np.empty(0, dtype=np.uint8)
+
+        # header parameters, the first occurrence of each key is used
+        header_values = {}
+        for head in header:
+            key, sep, value = head.partition("=")
+            if sep:
+                header_values.setdefault(key, value)
 
         # set the bin width - in ps
+        instrument = header[0].lower()
         bin_width = None
         for it in self.BinWidthTDC:
-            if it.name.lower() in header[0].lower():
+            if it.name.lower() in instrument:
                 bin_width = it.value
                 break
         if bin_width is None:
@@ -223,59 +253,43 @@ class LST2CRD:
 
         # find calfact - in ns
         calfact = None
-        for head in header:
-            if head[0:8] == "calfact=":
-                calfact = float(head.split("=")[1])
-                self._file_info["calfact"] = calfact
-                break
-
-        # find the range
-        for head in header:
-            if head[0:5] == "range":
-                ion_range = int(head.split("=")[1])
-                mult_fact = calfact / (bin_width / 1000)  # get range in bin_width
-                self._file_info["ion_range"] = int(ion_range * mult_fact)
-                break
+        if "calfact" in header_values:
+            calfact = float(header_values["calfact"])
+            self._file_info["calfact"] = calfact
+
+        # find the range, independent of where calfact is in the header
+        if "range" in header_values:
+            if calfact is None:
+                raise OSError("Could not find a calibration factor in the list file!")
+            ion_range = int(header_values["range"])
+            mult_fact = calfact / (bin_width / 1000)  # get range in bin_width
+            self._file_info["ion_range"] = int(ion_range * mult_fact)
 
         # find the data type, ascii or binary
-        data_type = None
-        for head in header:
-            if head[0:6] == "mpafmt":
-                data_type = head.split("=")[1]
-                self._file_info["data_type"] = data_type
-                break
+        data_type = header_values.get("mpafmt")
         if data_type is None:
             raise OSError("Could not find a data type in the list file!")
+        self._file_info["data_type"] = data_type
+        self._binary_file = data_type.lower() == "dat"
 
         # find the time patch
-        for head in header:
-            if head[0:10] == "time_patch":
-                time_patch = head.split("=")[1]
-                self._file_info["time_patch"] = time_patch
+        if "time_patch" in header_values:
+            self._file_info["time_patch"] = header_values["time_patch"]
 
         # Find timestamp
-        for head in header:
-            tmp_date_str = "cmline0="
-            if head[0 : len(tmp_date_str)] == tmp_date_str:
-                datetime_str = head.replace(tmp_date_str, "").split()
-                date_tmp = datetime_str[0].split("/")  # month, day, year
-                time_tmp = datetime_str[1].split(":")  # h, min, sec
-                self._file_info["timestamp"] = datetime(
-                    year=int(date_tmp[2]),
-                    month=int(date_tmp[0]),
-                    day=int(date_tmp[1]),
-                    hour=int(time_tmp[0]),
-                    minute=int(time_tmp[1]),
-                    second=int(float(time_tmp[2])),
-                )
-                break
+        if "cmline0" in header_values:
+            date_str, time_str = header_values["cmline0"].split()[:2]
+            time_str = time_str.split(".")[0]  # drop fractional seconds
+            self._file_info["timestamp"] = datetime.strptime(
+                f"{date_str} {time_str}", "%m/%d/%Y %H:%M:%S"
+            )
 
         # find the data format or raise an error
         self.set_data_format()
 
         # currently, only ascii data are supported. error checking in set_data_format()
         data_sig, tags, other_channels = lst_utils.ascii_to_ndarray(
-            data_ascii, self._data_format, self.channel_data, self.channel_tag
+            data, self._data_format, self.channel_data, self.channel_tag
         )
 
         self._data_signal = data_sig
@@ -306,9 +320,7 @@ class LST2CRD:
             )
 
         # calculate the maximum number of sweeps that can be recorded
-        max_sweeps = pow(
-            2, self.data_format.value[1][0][1] - self.data_format.value[1][0][0]
-        )
+        max_sweeps = 1 << self.data_format.sweep_bits
 
         ions_out_of_range_warning = False
         if self._channel_tag is not None:  # we have tagged data
@@ -413,34 +425,50 @@ class LST2CRD:
         bin_start = data_ions.min()
         bin_end = data_ions.max()
 
+        header = b"".join(
+            (
+                default["fileID"],
+                _PACK_DATETIME.pack(bytes(dt_fmt, "utf-8")),
+                default["minVer"],
+                default["majVer"],
+                default["sizeOfHeaders"],
+                default["shotPattern"],
+                default["tofFormat"],
+                default["polarity"],
+                _PACK_BINS.pack(self._file_info["bin_width"], bin_start, bin_end),
+                default["xDim"],
+                default["yDim"],
+                default["shotsPerPixel"],
+                default["pixelPerScan"],
+                default["nOfScans"],
+                _PACK_U32.pack(len(data_shots)),  # number of shots
+                default["deltaT"],
+            )
+        )
+
+        # data: every shot is followed by the arrival bins of its ions
+        data = lst_utils.interleave_shots_ions(data_shots, data_ions).astype(
+            "<u4", copy=False
+        )
+
         with open(fname, "wb") as fout:
-            # header
-            fout.write(default["fileID"])
-            fout.write(struct.pack("20s", bytes(dt_fmt, "utf-8")))
-            fout.write(default["minVer"])
-            fout.write(default["majVer"])
-            fout.write(default["sizeOfHeaders"])
-            fout.write(default["shotPattern"])
-            fout.write(default["tofFormat"])
-            fout.write(default["polarity"])
-            fout.write(struct.pack("<I", self._file_info["bin_width"]))
-            fout.write(struct.pack("<I", bin_start))
-            fout.write(struct.pack("<I", bin_end))
-            fout.write(default["xDim"])
-            fout.write(default["yDim"])
-            fout.write(default["shotsPerPixel"])
-            fout.write(default["pixelPerScan"])
-            fout.write(default["nOfScans"])
-            fout.write(struct.pack("<I", len(data_shots)))  # number of shots
-            fout.write(default["deltaT"])
-
-            # write the data
-            ion_cnt = 0
-            for shot in data_shots:
-                fout.write(struct.pack("<I", shot))
-                for _ in range(shot):
-                    fout.write(struct.pack("<I", data_ions[ion_cnt]))
-                    ion_cnt += 1
-
-            # EoF
+            fout.write(header)
+            data.tofile(fout)
             fout.write(default["eof"])
+
+
+def _channel_number(value: int) -> int:
+    """Validate a channel number.
+
+    Any integer is accepted, e.g., numpy integers, but a python int is returned.
+
+    :param value: Channel number.
+
+    :return: Channel number as python int.
+
+    :raises TypeError: Channel number is not an integer.
+    """
+    try:
+        return operator.index(value)
+    except TypeError as exc:
+        raise TypeError("Channel number must be given as an integer.") from exc
@@ -1,6 +1,6 @@
 """This file contains utilities for processing list files."""
 
-from typing import List, Tuple
+from typing import List, Tuple, Union
 
 from numba import njit
 import numpy as np
@@ -9,7 +9,10 @@ from .lst_to_crd import LST2CRD
 
 
 def ascii_to_ndarray(
-    data_list: List[str], fmt: LST2CRD.ASCIIFormat, channel: int, tag: int = None
+    data: Union[bytes, np.ndarray, List[str]],
+    fmt: LST2CRD.ASCIIFormat,
+    channel: int,
+    tag: int = None,
 ) -> Tuple[np.ndarray, np.ndarray, List]:
     """Turn ASCII LST data to a numpy array.
 
@@ -17,78 +20,169 @@ def ascii_to_ndarray(
     If channels other than the selected ones are available, these are written to a
     List and also returned as ``other_channels``.
 
-    :param data_list: Data, directly supplied from the TDC block.
+    :param data: Data, directly supplied from the TDC block, either as bytes, as an
+        array of uint8 (e.g., memory mapped), or as a list of lines.
     :param fmt: Format of the data
     :param channel: Channel the data is in
     :param tag: Channel the tag is in, or None if no tag
 
     :return: Data, Tag Data, Other Channels available
     """
-    # prepare the data and list
-    data_arr = np.empty((len(data_list), 2), dtype=np.uint32)
-    data_arr_tag = None
-    # initalize stuff for tags
-    if tag is not None:
-        data_arr_tag = np.empty(
-            len(data_list), dtype=np.uint32
-        )  # only sweep, not the channel
+    if isinstance(data, list):
+        data = "\n".join(data).encode("ascii")
+    values = hex_lines_to_uint64(np.frombuffer(data, dtype=np.uint8))
 
     # some helper variables for easy conversion
-    binary_width = fmt.value[0]
-    boundaries = fmt.value[1]
+    binary_width = fmt.binary_width
+    shifts, masks = np.array(
+        [_bit_field_params(bounds, binary_width) for bounds in fmt.value[1]],
+        dtype=np.uint64,
+    ).T
+
+    data_arr, data_arr_tag, other_channels = split_channels(
+        values, shifts, masks, channel, -1 if tag is None else tag
+    )
+    if tag is None:
+        data_arr_tag = None
 
-    # counter for ions in the right channel
-    ion_counter = 0
+    return data_arr, data_arr_tag, other_channels.tolist()
 
-    tag_counter = 0
 
-    other_channels = []
-
-    # transform to bin number with correct length
-    for data in data_list:
-        if data != "":
-            bin_tmp = f"{int(data, 16):{binary_width}b}".replace(" ", "0")
-            # parse data
-            tmp_channel = int(bin_tmp[boundaries[2][0] : boundaries[2][1]], 2)
-            if tmp_channel == channel:
-                swp_val, time_val = get_sweep_time_ascii(
-                    bin_tmp, boundaries[0], boundaries[1]
-                )
-                data_arr[ion_counter][0] = swp_val
-                data_arr[ion_counter][1] = time_val
-                ion_counter += 1
-            elif tmp_channel == tag:
-                swp_val, _ = get_sweep_time_ascii(bin_tmp, boundaries[0], boundaries[1])
-                data_arr_tag[tag_counter] = swp_val
-                tag_counter += 1
-            elif tmp_channel != 0:
-                if tmp_channel not in other_channels:
-                    other_channels.append(tmp_channel)
-
-    data_arr = data_arr[:ion_counter]
-    if tag is not None:
-        data_arr_tag = data_arr_tag[:tag_counter]
-
-    return data_arr, data_arr_tag, other_channels
-
-
-def get_sweep_time_ascii(
-    data: str, sweep_b: Tuple[int, int], time_b: Tuple[int, int]
+def _bit_field_params(
+    boundaries: Tuple[int, int], binary_width: int
 ) -> Tuple[int, int]:
-    """Get sweep and time from a given ASCII string.
+    """Get shift and mask to extract a bit field from a value.
 
-    :param data: ASCII string
-    :param sweep_b: Boundaries of sweep
-    :param time_b: Boundaries of time
+    :param boundaries: Start and stop of the field, counted from the most significant
+        bit of a number with ``binary_width`` bits.
+    :param binary_width: Width of the binary number.
 
-    :return: sweep, time
+    :return: Shift, mask
     """
-    sweep_val = int(data[sweep_b[0] : sweep_b[1]], 2)
-    time_val = int(data[time_b[0] : time_b[1]], 2)
-    return sweep_val, time_val
+    start, stop = boundaries
+    return binary_width - stop, (1 << (stop - start)) - 1
+
+
+@njit(cache=True, nogil=True)
+def hex_lines_to_uint64(data: np.ndarray) -> np.ndarray:  # pragma: nocover
+    """Parse lines of hexadecimal numbers into an array.
+
+    Empty lines are skipped, carriage returns and blanks are ignored.
+
+    :param data: Text encoded as ASCII, as an array of uint8.
+
+    :return: Value of each line.
+
+    :raises ValueError: Data contains characters that are not hexadecimal.
+    """
+    values = np.empty(data.shape[0] // 2 + 1, dtype=np.uint64)
+    nof_values = 0
+    value = np.uint64(0)
+    in_line = False
+    for char in data:
+        if char == 10:  # newline
+            if in_line:
+                values[nof_values] = value
+                nof_values += 1
+            value = np.uint64(0)
+            in_line = False
+            continue
+        elif 48 <= char <= 57:  # 0-9
+            digit = char - 48
+        elif 97 <= char <= 102:  # a-f
+            digit = char - 87
+        elif 65 <= char <= 70:  # A-F
+            digit = char - 55
+        elif char == 13 or char == 32 or char == 9:  # carriage return, blank, tab
+            continue
+        else:
+            raise ValueError("Data contains characters that are not hexadecimal.")
+        value = (value << np.uint64(4)) | np.uint64(digit)
+        in_line = True
+
+    if in_line:  # last line without newline
+        values[nof_values] = value
+        nof_values += 1
+
+    return values[:nof_values]
+
+
+@njit(cache=True, nogil=True)
+def split_channels(
+    values: np.ndarray, shifts: np.ndarray, masks: np.ndarray, channel: int, tag: int
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:  # pragma: nocover
+    """Extract sweep, time, and channel from the values and split them by channel.
 
+    :param values: Values as read from the list file.
+    :param shifts: Shifts to extract sweep, time, and channel (in this order).
+    :param masks: Masks to extract sweep, time, and channel (in this order).
+    :param channel: Channel the data is in.
+    :param tag: Channel the tag is in, -1 for no tag.
 
-@njit
+    :return: Data (sweep, time), tag data (sweep), other channels with counts in
+        order of their first appearance (channel 0 excluded)
+    """
+    other_seen = np.zeros(int(masks[2]) + 1, dtype=np.bool_)
+    other_channels = np.empty(int(masks[2]) + 1, dtype=np.int64)
+
+    # first pass: count, such that the output arrays can be allocated exactly
+    nof_ions = 0
+    nof_tags = 0
+    other_counter = 0
+    for value in values:
+        tmp_channel = np.int64((value >> shifts[2]) & masks[2])
+        if tmp_channel == channel:
+            nof_ions += 1
+        elif tmp_channel == tag:
+            nof_tags += 1
+        elif tmp_channel != 0 and not other_seen[tmp_channel]:
+            other_seen[tmp_channel] = True
+            other_channels[other_counter] = tmp_channel
+            other_counter += 1
+
+    # second pass: fill the data
+    data_arr = np.empty((nof_ions, 2), dtype=np.uint32)
+    data_arr_tag = np.empty(nof_tags, dtype=np.uint32)
+    ion_counter = 0
+    tag_counter = 0
+    for value in values:
+        tmp_channel = np.int64((value >> shifts[2]) & masks[2])
+        if tmp_channel == channel:
+            data_arr[ion_counter, 0] = (value >> shifts[0]) & masks[0]
+            data_arr[ion_counter, 1] = (value >> shifts[1]) & masks[1]
+            ion_counter += 1
+        elif tmp_channel == tag:
+            data_arr_tag[tag_counter] = (value >> shifts[0]) & masks[0]
+            tag_counter += 1
+
+    return data_arr, data_arr_tag, other_channels[:other_counter]
+
+
+@njit(cache=True, nogil=True)
+def interleave_shots_ions(
+    shots: np.ndarray, ions: np.ndarray
+) -> np.ndarray:  # pragma: nocover
+    """Interleave shots and ions into the order of the CRD data block.
+
+    :param shots: Array of how many ions are in each shot.
+    :param ions: Array of all arrival times of these ions.
+
+    :return: Data block of a CRD file: Every shot is followed by its ions.
+    """
+    data = np.empty(shots.shape[0] + ions.shape[0], dtype=np.uint32)
+    ind = 0
+    ion_ind = 0
+    for shot in shots:
+        data[ind] = shot
+        ind += 1
+        for _ in range(shot):
+            data[ind] = ions[ion_ind]
+            ind += 1
+            ion_ind += 1
+    return data
+
+
+@njit(cache=True, nogil=True)
 def transfer_lst_to_crd_data(
     data_in: np.ndarray, max_sweep: int, ion_range: int
 ) -> Tuple[np.ndarray, np.ndarray, bool]:  # pragma: nocover
@@ -100,15 +194,21 @@ def transfer_lst_to_crd_data(
 
     :return: Array of how many ions are in each shot, Array of all arrival times of
         these ions, and a bool if there are any ions out of range
+
+    :raises ValueError: Data are empty.
     """
-    data = data_in.copy()
+    if data_in.shape[0] == 0:
+        raise ValueError("Cannot transfer an empty data set to the CRD format.")
 
-    # go through and sort out max range issues
+    # go through and sort out max range issues, the input data are not modified
+    sweeps = np.empty(data_in.shape[0], dtype=data_in.dtype)
     threshold = max_sweep // 2
     multiplier = 0
-    last_shot = data[0][0]
-    for it in range(1, data.shape[0]):
-        curr_shot = data[it][0]
+    last_shot = data_in[0, 0]
+    sweeps[0] = last_shot
+    nof_shots = sweeps[0]  # highest sweep number
+    for it in range(1, data_in.shape[0]):
+        curr_shot = data_in[it, 0]
         if (
             curr_shot < threshold < last_shot and last_shot - curr_shot > threshold
         ):  # need to flip forward
@@ -119,32 +219,37 @@ def transfer_lst_to_crd_data(
             multiplier -= 1
         # modify data
         adder = multiplier * max_sweep
-        data[it][0] += adder
+        sweeps[it] = curr_shot + adder
+        if sweeps[it] > nof_shots:
+            nof_shots = sweeps[it]
         last_shot = curr_shot
 
-    # now sort the np array
-    data_sort = data[data[:, 0].argsort()]
-
-    # now create the shots and ions arrays and fill them
-    shots = np.zeros(data_sort[:, 0].max(), dtype=np.uint32)
-    ions = np.empty(
-        len(data_sort[:, 1][np.where(data_sort[:, 1] <= ion_range)]), dtype=np.uint32
-    )
-
-    it = 0
-    ions_out_of_range = False
-    for shot, ion in data_sort:
+    # count the ions in range per shot
+    shots = np.zeros(nof_shots, dtype=np.uint32)
+    for it in range(data_in.shape[0]):
+        if data_in[it, 1] <= ion_range:
+            shots[sweeps[it] - 1] += 1  # zero versus one based
+
+    # sort the ions into their shots (counting sort, keeps the order within a shot)
+    next_ion = np.empty(shots.shape[0], dtype=np.int64)
+    nof_ions = 0
+    for shot_ind, shot in enumerate(shots):
+        next_ion[shot_ind] = nof_ions
+        nof_ions += shot
+
+    ions = np.empty(nof_ions, dtype=np.uint32)
+    for it in range(data_in.shape[0]):
+        ion = data_in[it, 1]
         if ion <= ion_range:
-            shots[shot - 1] += 1  # zero versus one based
-            ions[it] = ion
-            it += 1
-        else:
-            ions_out_of_range = True
+            shot_ind = sweeps[it] - 1
+            ions[next_ion[shot_ind]] = ion
+            next_ion[shot_ind] += 1
 
+    ions_out_of_range = nof_ions < data_in.shape[0]
     return shots, ions, ions_out_of_range
 
 
-@njit
+@njit(cache=True, nogil=True)
 def separate_signal_with_tag(
     data_arr: np.ndarray, tag_arr: np.ndarray
 ) -> Tuple[np.ndarray, np.ndarray]:  # pragma: nocover
@@ -1,8 +1,27 @@
-"""GUIs to interactively set various variables in package."""
+"""GUIs to interactively set various variables in package.
 
-from .integrals import define_backgrounds_app, define_integrals_app
-from .mcal import create_mass_cal_app
-from .plots import dt_ions, integrals_packages, nof_ions_per_shot
+The GUI routines are only imported when they are first accessed, such that
+``import rimseval.guis`` does not pull in Qt, matplotlib, and ``scipy.stats`` before
+a GUI is actually used.
+"""
+
+import importlib
+from typing import TYPE_CHECKING, Any, List
+
+if TYPE_CHECKING:  # pragma: nocover
+    from .integrals import define_backgrounds_app, define_integrals_app
+    from .mcal import create_mass_cal_app
+    from .plots import dt_ions, integrals_packages, nof_ions_per_shot
+
+# functions that are imported on first access, name: submodule
+_LAZY_ATTRIBUTES = {
+    "create_mass_cal_app": "mcal",
+    "define_backgrounds_app": "integrals",
+    "define_integrals_app": "integrals",
+    "dt_ions": "plots",
+    "integrals_packages": "plots",
+    "nof_ions_per_shot": "plots",
+}
 
 __all__ = [
     "create_mass_cal_app",
@@ -12,3 +31,25 @@ __all__ = [
     "integrals_packages",
     "nof_ions_per_shot",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    """Import GUI routines on first access.
+
+    :param name: Name of the attribute.
+
+    :return: The requested routine.
+
+    :raises AttributeError: Attribute does not exist.
+    """
+    if name in _LAZY_ATTRIBUTES:
+        submodule = importlib.import_module(f".{_LAZY_ATTRIBUTES[name]}", __name__)
+        value = getattr(submodule, name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__() -> List[str]:
+    """Return all attributes, including the ones that are not imported yet."""
+    return sorted(set(globals()) | set(_LAZY_ATTRIBUTES))
@@ -3,6 +3,7 @@
 import sys
 from typing import List, Union
 
+from matplotlib.collections import PolyCollection
 import matplotlib.colors as mcolors
 import numpy as np
 from PyQt6 import QtCore, QtWidgets
@@ -12,12 +13,14 @@ from rimseval.processor import CRDFileProcessor
 import rimseval.processor_utils as pu
 from .mpl_canvas import PlotSpectrum
 
+_TABLEAU_COLORS = tuple(mcolors.TABLEAU_COLORS.values())
+
 
 class DefineAnyTemplate(PlotSpectrum):
     """Template to define integrals and backgrounds."""
 
     def __init__(self, crd: CRDFileProcessor, logy=True, theme: str = None) -> None:
-        """Get a PyQt5 window to define the mass calibration for the given data.
+        """Get a PyQt6 window to define the mass calibration for the given data.
 
         :param crd: The CRD file processor to work with.
         :param logy: Display the y axis logarithmically? Bottom set to 0.7
@@ -45,14 +48,15 @@ class DefineAnyTemplate(PlotSpectrum):
 
         # some variables
         self._last_xpos = None
+        self._shade_artists = []  # shaded areas, removed when peaks change
 
         # if integrals already exist
         if (crd_int := crd.def_integrals) is None:
             self.int_names = []
-            self.int_values = []
+            self.int_values = np.empty((0, 2))
         else:
             self.int_names, int_values = crd_int
-            self.int_values = list(int_values)
+            self.int_values = np.array(int_values, dtype=float)
 
         self.button_header = None
         self.button_tooltip = None
@@ -80,16 +84,15 @@ class DefineAnyTemplate(PlotSpectrum):
         """
         left = peak_pos[0]
         right = peak_pos[1]
+        dleft = self.int_values[:, 0]
+        dright = self.int_values[:, 1]
 
-        outlist = []
-        for it, [dleft, dright] in enumerate(self.int_values):
-            name = self.int_names[it]
-            if (
-                (dleft <= left < dright)
-                or (dleft < right <= dright)
-                or (left < dleft and right > dright)
-            ):
-                outlist.append(name)
+        overlapping = (
+            ((dleft <= left) & (left < dright))
+            | ((dleft < right) & (right <= dright))
+            | ((left < dleft) & (right > dright))
+        )
+        outlist = [self.int_names[it] for it in np.nonzero(overlapping)[0]]
 
         if outlist:
             return outlist
@@ -142,36 +145,41 @@ class DefineAnyTemplate(PlotSpectrum):
         raise NotImplementedError
 
     def shade_peaks(self):
-        """Shade the peaks with given integrals."""
-        # clear plot but keep axes limits (in case zoomed)
-        xax_lims = self.axes.get_xlim()
-        yax_lims = self.axes.get_ylim()
-        self.axes.clear()
-        self.plot_ms()
-        self.axes.set_xlim(xax_lims)
-        self.axes.set_ylim(yax_lims)
+        """Shade the peaks with given integrals.
 
-        # shade peaks
-        for it, peak_pos in enumerate(self.int_values):
-            indexes = np.where(
-                np.logical_and(self.crd.mass > peak_pos[0], self.crd.mass < peak_pos[1])
-            )
+        All previously shaded areas are removed, the mass spectrum itself is not
+        redrawn. Axes limits are thus kept, in case the user zoomed in.
+        """
+        for artist in self._shade_artists:
+            artist.remove()
+        self._shade_artists = []
+
+        if len(self.int_values) > 0:
+            # mass only ascends after its minimum (ToFs before t0 of the calibration)
+            mass_start = self.crd.mass.argmin()
+            mass = self.crd.mass[mass_start:]
+            data = self.crd.data[mass_start:]
+
+            # shade peaks
+            for it, peak_pos in enumerate(self.int_values):
+                ind_low = np.searchsorted(mass, peak_pos[0], side="right")
+                ind_high = np.searchsorted(mass, peak_pos[1], side="left")
+
+                artist = self.axes.fill_between(
+                    mass[ind_low:ind_high],
+                    data[ind_low:ind_high],
+                    color=tableau_color(it),
+                    linewidth=0.3,
+                )
+                self._shade_artists.append(artist)
 
-            self.axes.fill_between(
-                self.crd.mass[indexes],
-                self.crd.data[indexes],
-                color=tableau_color(it),
-                linewidth=0.3,
-            )
+        self.sc.draw_idle()
 
     def sort_integrals(self):
         """Sort the names and integrals using routine from processor_utilities."""
         if len(self.int_names) > 1:
-            def_integrals, _ = pu.sort_integrals(
-                (self.int_names, np.array(self.int_values))
-            )
-            self.int_names, int_values = def_integrals
-            self.int_values = list(int_values)
+            def_integrals, _ = pu.sort_integrals((self.int_names, self.int_values))
+            self.int_names, self.int_values = def_integrals
 
     def user_input(self, peak_pos: np.array, name: str = "") -> None:
         """Query user for position.
@@ -188,7 +196,7 @@ class DefineBackgrounds(DefineAnyTemplate):
     signal_backgrounds_defined = QtCore.pyqtSignal()
 
     def __init__(self, crd: CRDFileProcessor, logy=True, theme: str = None) -> None:
-        """Get a PyQt5 window to define backgrounds for the given integrals.
+        """Get a PyQt6 window to define backgrounds for the given integrals.
 
         :param crd: The CRD file processor to work with.
         :param logy: Display the y axis logarithmically? Bottom set to 0.7
@@ -241,36 +249,44 @@ class DefineBackgrounds(DefineAnyTemplate):
 
         :param name: Name of the peak.
         """
-        comp = True
-        while comp:
-            try:
-                index_to_pop = self.bg_names.index(name)
-                self.bg_names.pop(index_to_pop)
-                self.bg_values.pop(index_to_pop)
-            except ValueError:
-                comp = False
+        keep = [it for it, bg_name in enumerate(self.bg_names) if bg_name != name]
+        self.bg_names = [self.bg_names[it] for it in keep]
+        self.bg_values = [self.bg_values[it] for it in keep]
 
         self.peaks_changed()
 
     def peaks_changed(self):
         """Go through the list of peaks, make buttons and shade areas."""
-        self.shade_peaks()  # also restarts the canvas
+        self.shade_peaks()  # also removes the shaded backgrounds
         self.shade_backgrounds()
 
     def shade_backgrounds(self):
         """Go through background list and shade them.
 
-        .. note:: Canvas is not cleared prior to this!
-        """
-        for it, peak_pos in enumerate(self.bg_values):
-            int_name_index = self.int_names.index(self.bg_names[it])
-            col = tableau_color(int_name_index)
+        All backgrounds are drawn as one collection of vertical spans.
 
-            self.axes.axvspan(
-                peak_pos[0], peak_pos[1], linewidth=0, color=col, alpha=0.25
+        .. note:: Shaded areas are not removed prior to this!
+        """
+        if self.bg_values:
+            int_indexes = {name: it for it, name in enumerate(self.int_names)}
+            cols = [tableau_color(int_indexes[name]) for name in self.bg_names]
+            verts = [
+                ((left, 0), (left, 1), (right, 1), (right, 0))
+                for left, right in self.bg_values
+            ]
+
+            # x in data, y in axes coordinates, like ``axvspan``
+            artist = PolyCollection(
+                verts,
+                facecolors=cols,
+                linewidths=0,
+                alpha=0.25,
+                transform=self.axes.get_xaxis_transform(),
             )
+            self.axes.add_collection(artist, autolim=False)
+            self._shade_artists.append(artist)
 
-        self.sc.draw()
+        self.sc.draw_idle()
 
     def user_input(self, bg_pos: np.array, name: str = "") -> None:
         """Query user for position of background.
@@ -294,7 +310,7 @@ class DefineBackgrounds(DefineAnyTemplate):
             name = self._selected_peak_name
 
         self_corr, all_corr = pu.peak_background_overlap(
-            (self.int_names, np.array(self.int_values)), ([name], np.array([bg_pos]))
+            (self.int_names, self.int_values), ([name], np.array([bg_pos]))
         )
         if (
             not self_corr[1].shape == all_corr[1].shape
@@ -327,7 +343,7 @@ class DefineIntegrals(DefineAnyTemplate):
     signal_integrals_defined = QtCore.pyqtSignal()
 
     def __init__(self, crd: CRDFileProcessor, logy=True, theme: str = None) -> None:
-        """Get a PyQt5 window to define integrals in the given mass spectrum.
+        """Get a PyQt6 window to define integrals in the given mass spectrum.
 
         :param crd: The CRD file processor to work with.
         :param logy: Display the y axis logarithmically? Bottom set to 0.7
@@ -351,10 +367,10 @@ class DefineIntegrals(DefineAnyTemplate):
     def apply(self):
         """Apply the mass calibration and return it."""
         if self.int_names:
-            def_int = self.int_names, np.array(self.int_values)
+            def_int = self.int_names, self.int_values
             if self.crd.def_backgrounds:
                 self_corr, all_corr = pu.peak_background_overlap(
-                    (self.int_names, np.array(self.int_values)),
+                    def_int,
                     self.crd.def_backgrounds,
                 )
                 if (
@@ -389,7 +405,7 @@ class DefineIntegrals(DefineAnyTemplate):
         """
         index_to_pop = self.int_names.index(name)
         self.int_names.pop(index_to_pop)
-        self.int_values.pop(index_to_pop)
+        self.int_values = np.delete(self.int_values, index_to_pop, axis=0)
         self.peaks_changed()
 
     def peaks_changed(self):
@@ -442,7 +458,7 @@ class DefineIntegrals(DefineAnyTemplate):
                 )
             else:
                 self.int_names.append(name)
-                self.int_values.append(peak_pos)
+                self.int_values = np.vstack((self.int_values, peak_pos))
                 self.peaks_changed()
                 return
         else:
@@ -506,7 +522,7 @@ class PeakDialog(QtWidgets.QDialog):
 
 
 def define_backgrounds_app(crd: CRDFileProcessor, logy: bool = True) -> None:
-    """Create a PyQt5 app for defining backgruonds.
+    """Create a PyQt6 app for defining backgruonds.
 
     :param crd: CRD file to calibrate for.
     :param logy: Should the y axis be logarithmic? Defaults to True.
@@ -518,7 +534,7 @@ def define_backgrounds_app(crd: CRDFileProcessor, logy: bool = True) -> None:
 
 
 def define_integrals_app(crd: CRDFileProcessor, logy: bool = True) -> None:
-    """Create a PyQt5 app for defining integrals.
+    """Create a PyQt6 app for defining integrals.
 
     :param crd: CRD file to calibrate for.
     :param logy: Should the y axis be logarithmic? Defaults to True.
@@ -538,5 +554,4 @@ def tableau_color(it: int = 0) -> str:
 
     :return: Matplotlib color string.
     """
-    cols = list(mcolors.TABLEAU_COLORS.values())
-    return cols[it % len(cols)]
+    return _TABLEAU_COLORS[it % len(_TABLEAU_COLORS)]
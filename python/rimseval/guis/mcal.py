@@ -1,8 +1,8 @@
 """Interactive mass calibration using matplotlib's qtagg backend."""
 
-from functools import partial
+from functools import lru_cache
 import sys
-from typing import List, Tuple, Union
+from typing import Dict, List, Tuple, Union
 
 import numpy as np
 from PyQt6 import QtCore, QtWidgets
@@ -58,14 +58,15 @@ class CreateMassCalibration(PlotSpectrum):
 
         # some variables for guessing
         self._last_element = None
-        self._mass = None  # mass array for guessing
+        self._mcal_params = None  # mass calibration parameters for guessing
         self._mass_axis = None
 
-        # init mass calibration
+        # init mass calibration: buffer of (tof, mass) rows, first _mcal_n are set
         if mcal is None:
-            self._mcal = []
-        else:
-            self._mcal = mcal.tolist()
+            mcal = np.empty((0, 2), dtype=np.float64)
+        self._mcal_n = len(mcal)
+        self._mcal = np.empty((max(self._mcal_n, 16), 2), dtype=np.float64)
+        self._mcal[: self._mcal_n] = mcal
         self.check_mcal_length()
 
         # help in statusbar
@@ -82,12 +83,15 @@ class CreateMassCalibration(PlotSpectrum):
         :param tof: Time of flight.
         :param mass: Mass.
         """
-        self._mcal.append([tof, mass])
+        if self._mcal_n == len(self._mcal):  # buffer full
+            self._mcal = np.concatenate((self._mcal, np.empty_like(self._mcal)))
+        self._mcal[self._mcal_n] = tof, mass
+        self._mcal_n += 1
         self.check_mcal_length()
 
     def apply(self):
         """Apply the mass calibration and return it."""
-        self.crd.def_mcal = np.array(self._mcal)
+        self.crd.def_mcal = self._mcal[: self._mcal_n].copy()
         self.crd.mass_calibration()
         self.signal_calibration_applied.emit()
         self.close()
@@ -95,22 +99,24 @@ class CreateMassCalibration(PlotSpectrum):
     def check_mcal_length(self):
         """Check length of mcal to set button statuses, start guessing."""
         # apply button
-        if len(self._mcal) >= 2:
+        if self._mcal_n >= 2:
             # button
             self.apply_button.setDisabled(False)
             # mass calibration
-            self._mass, params = rimseval.processor_utils.mass_calibration(
-                np.array(self._mcal), self.crd.tof, return_params=True
+            mcal = self._mcal[: self._mcal_n]
+            _, params = rimseval.processor_utils.mass_calibration(
+                mcal, mcal[:, 0], return_params=True
             )
+            self._mcal_params = params
             # plot secondary axis
             self.secondary_axis(params=params, visible=True)
         else:
             self.apply_button.setDisabled(True)
-            self._mass = None
+            self._mcal_params = None
             self._last_element = None
             self.secondary_axis(visible=False)
 
-        if len(self._mcal) > 0:
+        if self._mcal_n > 0:
             self.undo_button.setDisabled(False)
         else:
             self.undo_button.setDisabled(True)
@@ -124,8 +130,12 @@ class CreateMassCalibration(PlotSpectrum):
 
         :return: Guessed mass.
         """
-        ind_tof = np.argmin(np.abs(self.crd.tof - tof))
-        mass = self._mass[ind_tof]
+        # ToF is sorted: closest of the two neighbors, the lower one on a tie
+        tofs = self.crd.tof
+        ind_tof = min(np.searchsorted(tofs, tof), len(tofs) - 1)
+        if ind_tof > 0 and tof - tofs[ind_tof - 1] <= tofs[ind_tof] - tof:
+            ind_tof -= 1
+        mass = rimseval.processor_utils.tof_to_mass(tofs[ind_tof], *self._mcal_params)
 
         if self._last_element is not None:  # guess with iniabu
             name_iso, mass_iso = find_closest_iso(mass, self._last_element)
@@ -145,18 +155,11 @@ class CreateMassCalibration(PlotSpectrum):
 
         :return: Mass of the peak as given by user.
         """
-        if self._mass is not None:
+        if self._mcal_params is not None:
             guess = self.guess_mass(tof)
         else:
             guess = ""
 
-        user_input = QtWidgets.QInputDialog.getText(
-            self,
-            "Calibrate Mass",
-            f"Enter isotope name or mass for {tof:.2f}us.",
-            text=guess,
-        )
-
         def err_invalid_entry():
             """Show Error Message for invalid entry."""
             QtWidgets.QMessageBox.warning(
@@ -179,22 +182,28 @@ class CreateMassCalibration(PlotSpectrum):
                 f"please enter the mass manually.",
             )
 
-        if user_input[1]:
+        while True:  # ask until the input is valid or the user cancels
+            user_input = QtWidgets.QInputDialog.getText(
+                self,
+                "Calibrate Mass",
+                f"Enter isotope name or mass for {tof:.2f}us.",
+                text=guess,
+            )
+            if not user_input[1]:
+                return None
+
             if (iso := user_input[0]) == "":
                 err_invalid_entry()
-                return self.query_mass(tof)
+                continue
             try:  # user input is a mass
                 mass = float(iso)
             except ValueError:
                 try:
-                    mass = ini.iso[iso].mass
-                    self._last_element = ini.iso[iso].name.split("-")[0]
+                    mass, self._last_element = _resolve_iso(iso)
                 except IndexError:
                     err_invalid_isotope(iso)
-                    return self.query_mass(tof)
+                    continue
             return mass
-        else:
-            return
 
     def right_click_event(self, xpos: float, *args, **kwargs) -> None:
         """Act on an emitted right click event."""
@@ -204,12 +213,11 @@ class CreateMassCalibration(PlotSpectrum):
 
         min_value = xpos - 2 * self.crd.peak_fwhm
         max_value = xpos + 2 * self.crd.peak_fwhm
-        window = np.where(
-            np.logical_and(self.crd.tof > min_value, self.crd.tof < max_value)
-        )
+        ind_min = np.searchsorted(self.crd.tof, min_value, side="right")
+        ind_max = np.searchsorted(self.crd.tof, max_value, side="left")
 
-        xdata = self.crd.tof[window]
-        ydata = self.crd.data[window]
+        xdata = self.crd.tof[ind_min:ind_max]
+        ydata = self.crd.data[ind_min:ind_max]
 
         tof_max = gaussian_fit_get_max(xdata, ydata)
 
@@ -240,36 +248,35 @@ class CreateMassCalibration(PlotSpectrum):
                 return
             else:
                 if self._mass_axis is not None:
-                    self._mass_axis.set_visible(False)
+                    self._mass_axis.remove()
+                tm0, const = params
+
+                def forward(tm):
+                    """Transform ToF to mass with the current parameters."""
+                    return ((tm - tm0) / const) ** 2
+
+                def inverse(m):
+                    """Transform mass to ToF with the current parameters."""
+                    return np.sqrt(m) * const + tm0
+
                 self._mass_axis = self.axes.secondary_xaxis(
-                    "top",
-                    functions=(
-                        partial(
-                            rimseval.processor_utils.tof_to_mass,
-                            tm0=params[0],
-                            const=params[1],
-                        ),
-                        partial(
-                            rimseval.processor_utils.mass_to_tof,
-                            tm0=params[0],
-                            const=params[1],
-                        ),
-                    ),
+                    "top", functions=(forward, inverse)
                 )
                 self._mass_axis.set_xlabel("Mass (amu)")
                 if self.theme == "dark":
                     self._mass_axis.set_color("tab:orange")
                 else:
                     self._mass_axis.set_color("tab:red")
-                self.sc.draw()
+                self.sc.draw_idle()
         elif self._mass_axis is not None:
-            self._mass_axis.set_visible(False)
+            self._mass_axis.remove()
             self._mass_axis = None
-            self.sc.draw()
+            self.sc.draw_idle()
 
     def undo_last_mcal(self):
-        """Undo the last mass calibration by popping the last entry of list."""
-        tof, mass = self._mcal.pop()
+        """Undo the last mass calibration by dropping the last entry."""
+        self._mcal_n -= 1
+        tof, mass = self._mcal[self._mcal_n]
         self.status_bar.showMessage(
             f"Deleted calibration with mass {mass:.2f} at {tof:.2f}us."
         )
@@ -277,7 +284,7 @@ class CreateMassCalibration(PlotSpectrum):
 
 
 def create_mass_cal_app(crd: CRDFileProcessor, logy: bool = True, theme=None) -> None:
-    """Create a PyQt5 app for the mass cal window.
+    """Create a PyQt6 app for the mass cal window.
 
     :param crd: CRD file to calibrate for.
     :param logy: Should the y axis be logarithmic? Defaults to True.
@@ -300,8 +307,84 @@ def find_closest_iso(mass: float, key: List = None) -> Tuple[str, float]:
 
     :return: Closest isotpoe, name and mass as tuple.
     """
-    if key is None:
-        key = list(ini.ele_dict.keys())
+    names, masses, ele_slices = _isotope_table()
+    if key is None:  # all isotopes: reuse a scratch buffer for the differences
+        diff = _isotope_table_buffer()
+        np.subtract(masses, mass, out=diff)
+        index = np.abs(diff, out=diff).argmin()
+        return str(names[index]), masses[index]
+    elif isinstance(key, str) and key in ele_slices:
+        ind = ele_slices[key]
+    else:  # any other iniabu key, e.g., isotopes or lists
+        if isinstance(key, list):  # make hashable for the cache
+            key = tuple(key)
+        names, masses = _isotopes(key)
+        ind = slice(None)
+
+    index = np.argmin(np.abs(masses[ind] - mass))
+    return str(names[ind][index]), masses[ind][index]
+
+
+@lru_cache(maxsize=1)
+def _isotope_table() -> Tuple[np.ndarray, np.ndarray, Dict[str, slice]]:
+    """Return names and masses of all isotopes in iniabu, sorted by element.
+
+    Looking up isotopes in iniabu is slow, hence the table is built once. The
+    isotopes of each element are a contiguous slice of the table.
+
+    :return: Names of all isotopes, masses of all isotopes, slice into these arrays
+        for every element.
+    """
+    names = []
+    masses = []
+    ele_slices = {}
+    for ele in ini.ele_dict:
+        ele_names, ele_masses = _isotopes(ele)
+        ele_slices[ele] = slice(len(names), len(names) + len(ele_names))
+        names += ele_names
+        masses += ele_masses.tolist()
+    return np.array(names), np.array(masses, dtype=np.float64), ele_slices
+
+
+@lru_cache(maxsize=1)
+def _isotope_table_buffer() -> np.ndarray:
+    """Return a scratch buffer with the same shape as the masses of the table.
+
+    The GUI runs in a single thread, hence the buffer can be shared between calls.
+
+    :return: Uninitialized array of the length of the isotope table.
+    """
+    return np.empty_like(_isotope_table()[1])
+
+
+@lru_cache(maxsize=None)
+def _isotopes(key: Union[str, Tuple[str]]) -> Tuple[Tuple[str], np.ndarray]:
+    """Return names and masses of the isotopes for a given iniabu key.
+
+    Looking up isotopes in iniabu is slow, hence the result is cached for every key.
+
+    :param key: An element or isotope key that is valid for iniabu.
+
+    :return: Names of the isotopes, masses of the isotopes.
+    """
+    if isinstance(key, tuple):
+        key = list(key)
     isos = ini.iso[key]
-    index = np.argmin(np.abs(isos.mass - mass))
-    return isos.name[index], isos.mass[index]
+    names = [isos.name] if isinstance(isos.name, str) else isos.name
+    return tuple(names), np.atleast_1d(np.asarray(isos.mass, dtype=float))
+
+
+@lru_cache(maxsize=512)
+def _resolve_iso(iso: str) -> Tuple[float, str]:
+    """Return the mass and the element of an isotope entered by the user.
+
+    Results are cached, such that re-entering an isotope skips the iniabu lookup.
+
+    :param iso: Isotope name as entered by the user, e.g., 46Ti, Ti46, or Ti-46.
+
+    :return: Mass of the isotope, element name.
+
+    :raises IndexError: The isotope is not in the iniabu database.
+    """
+    isotope = ini.iso[iso]
+    return isotope.mass, isotope.name.split("-")[0]
@@ -5,7 +5,8 @@ from matplotlib.backends.backend_qtagg import (
     NavigationToolbar2QT as NavigationToolbar,
 )
 from matplotlib.figure import Figure
-import matplotlib.pyplot as plt
+import matplotlib.style
+import numpy as np
 from PyQt6 import QtCore, QtWidgets
 
 try:
@@ -22,7 +23,7 @@ class PlotSpectrum(QtWidgets.QMainWindow):
     def __init__(
         self, crd: CRDFileProcessor, logy: bool = True, theme: str = None
     ) -> None:
-        """Get a PyQt5 window to define the mass calibration for the given data.
+        """Get a PyQt6 window to define the mass calibration for the given data.
 
         :param crd: The CRD file processor to work with.
         :param logy: Display the y axis logarithmically? Bottom set to 0.7
@@ -36,11 +37,16 @@ class PlotSpectrum(QtWidgets.QMainWindow):
             self.setStyleSheet(qdarktheme.load_stylesheet(theme))
 
         if theme == "dark":
-            plt.style.use("dark_background")
+            matplotlib.style.use("dark_background")
 
         self.crd = crd
         self.logy = logy
 
+        # full data that is plotted and its (decimated) artist
+        self._plot_xdata = None
+        self._plot_ydata = None
+        self._plot_artist = None
+
         # create a matpotlib canvas using my own canvas
         self.fig = Figure(figsize=(9, 6), dpi=100)
         sc = MplCanvasRightClick(self.fig)
@@ -86,6 +92,9 @@ class PlotSpectrum(QtWidgets.QMainWindow):
 
         self.setCentralWidget(widget)
 
+        # re-decimate the plotted data for the visible range when zooming / panning
+        self.axes.callbacks.connect("xlim_changed", self._update_plot_data)
+
     def logy_toggle(self):
         """Toggle logy."""
         self.logy = not self.logy
@@ -98,7 +107,7 @@ class PlotSpectrum(QtWidgets.QMainWindow):
             self.axes.set_yscale("linear")
             self.axes.set_ylim(bottom=0)
 
-        self.sc.draw()
+        self.sc.draw_idle()
 
     def plot_tof(self):
         """Plot ToF spectrum."""
@@ -126,14 +135,57 @@ class PlotSpectrum(QtWidgets.QMainWindow):
 
         color = "w" if self.theme == "dark" else "k"
 
-        self.axes.fill_between(xax, self.crd.data, color=color, linewidth=0.3)
+        self._plot_xdata = xax
+        self._plot_ydata = self.crd.data
+        ind = _minmax_indexes(self.crd.data, self._nof_plot_bins())
+        self._plot_artist = self.axes.fill_between(
+            xax[ind], self.crd.data[ind], color=color, linewidth=0.3
+        )
         self.axes.set_xlabel(xlabel)
         self.axes.set_ylabel("Counts")
         if self.logy:
             self.axes.set_yscale("log")
             self.axes.set_ylim(bottom=0.7)
 
-        self.sc.draw()
+        self.sc.draw_idle()
+
+    def _nof_plot_bins(self) -> int:
+        """Get the number of bins to decimate the plotted data into.
+
+        :return: Number of bins, two per pixel of the axes width.
+        """
+        return max(2 * int(self.axes.bbox.width), 1)
+
+    def _update_plot_data(self, axes) -> None:
+        """Decimate the plotted data for the visible x range and update the plot.
+
+        Only the vertices of the existing artist are replaced, such that the axes
+        limits are not touched.
+
+        :param axes: Axes whose x limits changed.
+        """
+        if self._plot_artist is None or self._plot_artist.axes is None:
+            return
+
+        xmin, xmax = sorted(axes.get_xlim())
+        visible = np.nonzero((self._plot_xdata >= xmin) & (self._plot_xdata <= xmax))[0]
+        if len(visible) == 0:
+            return
+        # add the neighboring points such that the plot reaches the edges
+        ind_low = max(visible[0] - 1, 0)
+        ind_high = min(visible[-1] + 2, len(self._plot_xdata))
+
+        ydat_visible = self._plot_ydata[ind_low:ind_high]
+        ind = _minmax_indexes(ydat_visible, self._nof_plot_bins()) + ind_low
+        xdat = self._plot_xdata[ind]
+        ydat = self._plot_ydata[ind]
+        verts = np.column_stack(
+            (
+                np.concatenate((xdat[:1], xdat, xdat[-1:])),
+                np.concatenate(([0], ydat, [0])),
+            )
+        )
+        self._plot_artist.set_verts([verts])
 
 
 class MplCanvasRightClick(FigureCanvas):
@@ -200,3 +252,34 @@ class MyMplNavigationToolbar(NavigationToolbar):
         """Run a normal zoom release event and then untoggle button."""
         super().release_zoom(event)
         self.zoom()  # untoggle zoom button
+
+
+def _minmax_indexes(ydat: np.ndarray, nof_bins: int) -> np.ndarray:
+    """Get the indexes to plot data decimated into a given number of bins.
+
+    For every bin, the indexes of its minimum and its maximum are kept, such that
+    peaks are preserved. The first and last index are always kept. If the data
+    has no more than two points per bin, all indexes are returned.
+
+    :param ydat: Data to decimate.
+    :param nof_bins: Number of bins to decimate the data into.
+
+    :return: Sorted indexes of the data points to plot.
+    """
+    length = len(ydat)
+    if length <= 2 * nof_bins:
+        return np.arange(length)
+
+    stride = -(-length // nof_bins)  # ceil division
+    len_full = length // stride * stride
+
+    blocks = ydat[:len_full].reshape(-1, stride)
+    ind = np.column_stack((blocks.argmin(axis=1), blocks.argmax(axis=1)))
+    ind += np.arange(len(blocks))[:, np.newaxis] * stride
+
+    rest = ydat[len_full:]
+    if len(rest) > 0:
+        ind_rest = np.array([rest.argmin(), rest.argmax()]) + len_full
+        ind = np.concatenate((ind.ravel(), ind_rest))
+
+    return np.unique(np.concatenate(([0], ind.ravel(), [length - 1])))
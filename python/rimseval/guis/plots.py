@@ -6,7 +6,7 @@ from typing import Tuple
 
 from matplotlib.backends.backend_qtagg import FigureCanvasQTAgg as FigureCanvas
 from matplotlib.figure import Figure
-import matplotlib.pyplot as plt
+import matplotlib.style
 from numba import njit
 import numpy as np
 from PyQt6 import QtWidgets
@@ -29,7 +29,7 @@ class PlotFigure(QtWidgets.QMainWindow):
     """QMainWindow to plot a Figure."""
 
     def __init__(self, logy: bool = False, theme: str = None) -> None:
-        """Get a PyQt5 window to define the mass calibration for the given data.
+        """Get a PyQt6 window to define the mass calibration for the given data.
 
         :param logy: Display the y axis logarithmically? Bottom set to 0.7
         :param theme: Theme, if applicable ("dark" or "light", default None)
@@ -42,7 +42,7 @@ class PlotFigure(QtWidgets.QMainWindow):
             self.setStyleSheet(qdarktheme.load_stylesheet(theme))
 
         if theme == "dark":
-            plt.style.use("dark_background")
+            matplotlib.style.use("dark_background")
             self.main_color = "w"
         else:
             self.main_color = "tab:blue"
@@ -99,7 +99,7 @@ class PlotFigure(QtWidgets.QMainWindow):
             self.axes.set_yscale("linear")
             self.axes.set_ylim(bottom=0)
 
-        self.sc.draw()
+        self.sc.draw_idle()
 
 
 class DtIons(PlotFigure):
@@ -159,7 +159,7 @@ class DtIons(PlotFigure):
         self.axes.set_xlim(left=0)
         self.axes.set_ylim(bottom=0)
 
-        self.sc.draw()
+        self.sc.draw_idle()
 
 
 class IntegralsPerPackage(PlotFigure):
@@ -213,7 +213,7 @@ class IntegralsPerPackage(PlotFigure):
         )
         self.axes.legend()
 
-        self.sc.draw()
+        self.sc.draw_idle()
 
 
 class IonsPerShot(PlotFigure):
@@ -262,7 +262,7 @@ class IonsPerShot(PlotFigure):
         )
         self.axes.legend()
 
-        self.sc.draw()
+        self.sc.draw_idle()
 
 
 def dt_ions(
@@ -69,16 +69,20 @@ def load_cal_file(crd: CRDFileProcessor, fname: Path = None) -> None:
     :param fname: Filename and path. If `None`, try file with same name as CRD file but
         `.json` suffix.
 
-    :raises OSError: Calibration file does not exist.
+    :raises FileNotFoundError: Calibration file does not exist.
     :raises OSError: JSON file cannot be decoded. JSON error message is returned too.
     """
     if fname is None:
         fname = crd.fname.with_suffix(".json")
 
-    if not fname.exists():
-        raise OSError(f"The requested calibration file {fname} does not exist.")
+    try:  # open directly instead of checking for existence first
+        fin = open(fname, "r", encoding="utf-8")
+    except FileNotFoundError as orig_err:
+        raise FileNotFoundError(
+            f"The requested calibration file {fname} does not exist."
+        ) from orig_err
 
-    with fname.open("r", encoding="utf-8") as fin:
+    with fin:
         try:
             json_object = json.load(fin)
         except json.decoder.JSONDecodeError as orig_err:
@@ -88,10 +92,7 @@ def load_cal_file(crd: CRDFileProcessor, fname: Path = None) -> None:
 
     def entry_loader(key: str, json_obj: Any) -> Any:
         """Return the value of a json_object dictionary if existent, otherwise None."""
-        if key in json_obj.keys():
-            return json_obj[key]
-        else:
-            return None
+        return json_obj.get(key)
 
     # mass cal
     mcal = entry_loader("mcal", json_object)
@@ -152,6 +153,12 @@ def save_cal_file(crd: CRDFileProcessor, fname: Path = None) -> None:
     if crd.applied_filters != {}:
         cal_to_write["applied_filters"] = crd.applied_filters
 
-    json_object = json.dumps(cal_to_write, indent=4)
+    def numpy_scalar(obj: Any) -> Any:
+        """Turn numpy scalars, e.g., filter values set by the user, into Python ones."""
+        if isinstance(obj, np.generic):
+            return obj.item()
+        raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+    json_object = json.dumps(cal_to_write, indent=4, default=numpy_scalar)
 
     fname.write_text(json_object, encoding="utf-8")
@@ -1,5 +1,6 @@
 """Process multiple CRD files, open them, handle individually, enable batch runs."""
 
+from concurrent.futures import ThreadPoolExecutor
 import gc
 from pathlib import Path
 from typing import List
@@ -195,18 +196,25 @@ class MultiFileProcessor(QtCore.QObject):
         :param secondary_cal: Optional, calibration to fall back on if no primary
             calibration is available.
         """
-        if (calfile := crd.fname.with_suffix(".json")).is_file():
-            pass
-        elif secondary_cal is not None and (calfile := secondary_cal).is_file():
-            pass
-        else:
-            return
+        calfiles = [crd.fname.with_suffix(".json")]
+        if secondary_cal is not None:
+            calfiles.append(secondary_cal)
 
-        rimseval.interfacer.load_cal_file(crd, calfile)
+        for calfile in calfiles:  # try to load instead of probing for the files first
+            try:
+                rimseval.interfacer.load_cal_file(crd, calfile)
+                return
+            except FileNotFoundError:
+                continue
 
     def open_files(self) -> None:
-        """Open the files and store them in the list."""
-        files = [CRDFileProcessor(fname) for fname in self.crd_files]
+        """Open the files and store them in the list.
+
+        Files are read in parallel threads. Reading is mostly done in numpy and in
+        jitted routines that release the GIL.
+        """
+        with ThreadPoolExecutor() as executor:
+            files = list(executor.map(CRDFileProcessor, self.crd_files))
         self._files = files
 
     def open_additional_files(
@@ -595,13 +595,8 @@ class CRDFileProcessor:
         self.nof_shots_pkg = np.delete(self.nof_shots_pkg, index_list)
         self.nof_shots = np.sum(self.nof_shots_pkg)
 
-        # integrals
-        integrals = np.zeros_like(self.integrals)
-        integrals[:, 0] = integrals_pkg.sum(axis=0)[:, 0]
-        integrals[:, 1] = np.sqrt(np.sum(integrals_pkg[:, :, 1] ** 2, axis=0))
-
         # write back
-        self.integrals = integrals
+        self.integrals = processor_utils.integrals_pkg_sum(integrals_pkg)
         self.integrals_pkg = integrals_pkg
 
     def integrals_calc(self, bg_corr=True) -> None:
@@ -694,10 +689,9 @@ class CRDFileProcessor:
         integrals_delta = processor_utils.delta_calc(peak_names, self.integrals)
 
         if self.integrals_pkg is not None:
-            integrals_delta_pkg = np.zeros_like(self.integrals_pkg, dtype=float)
-            for it, line in enumerate(self.integrals_pkg):
-                integrals_delta_pkg[it] = processor_utils.delta_calc(peak_names, line)
-            self.integrals_delta_pkg = integrals_delta_pkg
+            self.integrals_delta_pkg = processor_utils.delta_calc(
+                peak_names, self.integrals_pkg
+            )
 
         self.integrals_delta = integrals_delta
 
@@ -741,14 +735,20 @@ class CRDFileProcessor:
         positions = self.def_mcal[:, 0]
         positions_new = np.zeros_like(positions) * np.nan  # nan array
 
+        tof = self.tof
+        tof_max = tof.max()
+        width = 2 * self.peak_fwhm
+
         for it, pos in enumerate(positions):
-            min_time = pos - offset - 2 * self.peak_fwhm
-            max_time = pos + offset + 2 * self.peak_fwhm
-            if max_time > self.tof.max():  # we don't have a value here
+            min_time = pos - offset - width
+            max_time = pos + offset + width
+            if max_time > tof_max:  # we don't have a value here
                 continue
-            window = np.where(np.logical_and(self.tof > min_time, self.tof < max_time))
-            tofs = self.tof[window]
-            data = self.data[window]
+            # tof is sorted: the open interval (min_time, max_time) is a slice
+            ind_min = np.searchsorted(tof, min_time, side="right")
+            ind_max = np.searchsorted(tof, max_time, side="left")
+            tofs = tof[ind_min:ind_max]
+            data = self.data[ind_min:ind_max]
             positions_new[it] = processor_utils.gaussian_fit_get_max(tofs, data)
 
         mcal_new = self.def_mcal.copy()
@@ -857,7 +857,7 @@ class CRDFileProcessor:
         """
         if def_integrals := self.def_integrals:
             sorted_integrals, sort_ind = processor_utils.sort_integrals(def_integrals)
-            if sort_ind:
+            if sort_ind is not None:
                 self.def_integrals = sorted_integrals
 
                 if self.integrals is not None and sort_vals:
@@ -120,11 +120,57 @@ def delta_calc(names: List[str], integrals: np.ndarray) -> np.ndarray:
     If the name of a peak is not valid or the major isotope not present, return
     ``np.nan`` for that entry. Appropriate error propagation is done as well.
 
+    The integrals can also be stacked, e.g., the integrals of all packages as defined
+    in ``CRDFileProcessor.integrals_pkg``. The peak names are then only resolved once
+    per call for all packages.
+
     :param names: Names of the peaks as list.
-    :param integrals: Integrals, as defined in ``CRDFileProcessor.integrals``.
+    :param integrals: Integrals, as defined in ``CRDFileProcessor.integrals`` or
+        ``CRDFileProcessor.integrals_pkg``.
 
     :return: List of delta values, same shape and format as ``integrals``.
     """
+    integrals_delta = np.full_like(integrals, np.nan, dtype=float)
+
+    with warnings.catch_warnings():
+        if rimseval.VERBOSITY < 2:
+            warnings.simplefilter("ignore", category=RuntimeWarning)
+
+        for it, norm_it, iso, norm_iso in _delta_calc_isotopes(names):
+            msr_nom = integrals[..., it, 0]
+            msr_nom_unc = integrals[..., it, 1]
+            msr_denom = integrals[..., norm_it, 0]
+            msr_denom_unc = integrals[..., norm_it, 1]
+
+            msr_ratio = msr_nom / msr_denom
+            integrals_delta[..., it, 0] = ini.iso_delta(iso, norm_iso, msr_ratio)
+
+            # error calculation
+            std_ratio = ini.iso_ratio(iso, norm_iso)
+            integrals_delta[..., it, 1] = (
+                1000
+                / std_ratio
+                * np.sqrt(
+                    (msr_nom_unc / msr_denom) ** 2
+                    + (msr_nom * msr_denom_unc / msr_denom**2) ** 2
+                )
+            )
+
+    return integrals_delta
+
+
+def _delta_calc_isotopes(names: List[str]) -> List[Tuple[int, int, str, str]]:
+    """Find the peaks for which delta values can be calculated.
+
+    The peak names are resolved with ``iniabu``. The result is not cached, since it
+    depends on the normalization isotopes that are currently set in ``iniabu``.
+
+    :param names: Names of the peaks.
+
+    :return: Index of the peak, index of its normalizing isotope, ``iniabu`` name of
+        the peak and of its normalizing isotope for every peak that is a valid isotope
+        whose normalizing isotope is present.
+    """
     # transform all names to valid ``iniabu`` names or call them ``None``
     names_iniabu = []
     for name in names:
@@ -133,50 +179,18 @@ def delta_calc(names: List[str], integrals: np.ndarray) -> np.ndarray:
         except IndexError:
             names_iniabu.append(None)
 
-    # find major isotope names
-    norm_iso_name = []
-    for name in names_iniabu:
-        if name is None:
-            norm_iso_name.append(None)
-        else:
-            ele = name.split("-")[0]
-            maj = ini._get_norm_iso(ele)  # can't give index error if above passed
-            norm_iso_name.append(maj)
-
     integrals_dict = dict(zip(names_iniabu, range(len(names_iniabu))))  # noqa: B905
 
-    integrals_delta = np.zeros_like(integrals, dtype=float)
-
+    delta_isos = []
     for it, iso in enumerate(names_iniabu):
-        norm_iso = norm_iso_name[it]
-
-        if iso is None or norm_iso not in names_iniabu:
-            integrals_delta[it][0] = np.nan
-            integrals_delta[it][1] = np.nan
-        else:
-            msr_nom = integrals[it][0]
-            msr_nom_unc = integrals[it][1]
-            msr_denom = integrals[integrals_dict[norm_iso]][0]
-            msr_denom_unc = integrals[integrals_dict[norm_iso]][1]
-
-            with warnings.catch_warnings():
-                if rimseval.VERBOSITY < 2:
-                    warnings.simplefilter("ignore", category=RuntimeWarning)
-                msr_ratio = msr_nom / msr_denom
-                integrals_delta[it][0] = ini.iso_delta(iso, norm_iso, msr_ratio)
-
-                # error calculation
-                std_ratio = ini.iso_ratio(iso, norm_iso)
-                integrals_delta[it][1] = (
-                    1000
-                    / std_ratio
-                    * np.sqrt(
-                        (msr_nom_unc / msr_denom) ** 2
-                        + (msr_nom * msr_denom_unc / msr_denom**2) ** 2
-                    )
-                )
+        if iso is None:
+            continue
+        ele = iso.split("-")[0]
+        norm_iso = ini._get_norm_iso(ele)  # can't give index error if above passed
+        if norm_iso in integrals_dict:
+            delta_isos.append((it, integrals_dict[norm_iso], iso, norm_iso))
 
-    return integrals_delta
+    return delta_isos
 
 
 def gaussian_fit_get_max(xdata: np.ndarray, ydata: np.ndarray) -> float:
@@ -222,10 +236,6 @@ def integrals_bg_corr(
     need to be subtracted from and that the names of the integrals are unique. The
     latter point is tested when defining the integrals.
 
-    .. note:: This routine currently cannot be jitted since we are using an
-        ``np.where`` statement. If required for speed, we can go an replace that
-        statement. Most likely, this is plenty fast enough though.
-
     :param integrals: Integrals and uncertianties for all defined peaks.
     :param int_names: Name of the individual peaks. Must be unique values!
     :param int_ch: Number of channels for the whole peak width.
@@ -243,24 +253,28 @@ def integrals_bg_corr(
     else:
         integrals_corr_pkg = np.zeros_like(int_pkg)
 
+    # indexes of the backgrounds for each integral, same for data and all packages
+    bgs_dict = {}
+    for it, name in enumerate(bgs_names):
+        bgs_dict.setdefault(name, []).append(it)
+    bg_indexes_all = [np.array(bgs_dict.get(name, []), dtype=int) for name in int_names]
+
     def do_correction(
         integrals_in,
-        int_names_in,
+        bg_indexes_in,
         int_ch_in,
         bgs_in,
-        bgs_names_in,
         bgs_ch_in,
+        integrals_corr_in,
     ):
-        """Run the correction, same variable names as outer scope."""
-        integrals_corr_in = np.zeros_like(integrals_in)
-
+        """Run the correction and write it into ``integrals_corr_in`` in place."""
         bgs_cnt = bgs_in[:, 0]  # get only the counts in the backgrounds, no uncertainty
         bgs_norm = bgs_cnt / bgs_ch_in
         bgs_norm_unc = np.sqrt(bgs_cnt) / bgs_ch_in
 
         for it in range(len(integrals_in)):
             int_value = integrals_in[it][0]
-            bg_indexes = np.where(bgs_names_in == int_names_in[it])[0]
+            bg_indexes = bg_indexes_in[it]
             if len(bg_indexes) > 0:  # background actually exists
                 bg_norm = np.sum(bgs_norm[bg_indexes]) / len(bg_indexes)
                 bg_norm_unc = np.sum(bgs_norm_unc[bg_indexes]) / len(bg_indexes)
@@ -273,20 +287,48 @@ def integrals_bg_corr(
             else:
                 integrals_corr_in[it][0] = int_value
                 integrals_corr_in[it][1] = np.sqrt(int_value)
-        return integrals_corr_in
 
     # for integrals, not packages
-    integrals_corr = do_correction(integrals, int_names, int_ch, bgs, bgs_names, bgs_ch)
+    do_correction(integrals, bg_indexes_all, int_ch, bgs, bgs_ch, integrals_corr)
 
     if integrals_corr_pkg is not None:
         for it_pkg in range(len(integrals_corr_pkg)):
-            integrals_corr_pkg[it_pkg] = do_correction(
-                int_pkg[it_pkg], int_names, int_ch, bgs_pkg[it_pkg], bgs_names, bgs_ch
+            do_correction(
+                int_pkg[it_pkg],
+                bg_indexes_all,
+                int_ch,
+                bgs_pkg[it_pkg],
+                bgs_ch,
+                integrals_corr_pkg[it_pkg],
             )
 
     return integrals_corr, integrals_corr_pkg
 
 
+@njit(cache=True, nogil=True)
+def integrals_pkg_sum(integrals_pkg: np.ndarray) -> np.ndarray:  # pragma: nocover
+    """Sum up the integrals of all packages.
+
+    The integrals are summed and their uncertainties are added in quadrature.
+
+    :param integrals_pkg: Integrals of the packages, as defined in
+        ``CRDFileProcessor.integrals_pkg``.
+
+    :return: Integrals, as defined in ``CRDFileProcessor.integrals``.
+    """
+    nof_pkg, nof_peaks, _ = integrals_pkg.shape
+    integrals = np.empty((nof_peaks, 2))
+    for it in range(nof_peaks):
+        int_sum = 0.0
+        unc_sq_sum = 0.0
+        for ht in range(nof_pkg):
+            int_sum += integrals_pkg[ht, it, 0]
+            unc_sq_sum += integrals_pkg[ht, it, 1] * integrals_pkg[ht, it, 1]
+        integrals[it, 0] = int_sum
+        integrals[it, 1] = np.sqrt(unc_sq_sum)
+    return integrals
+
+
 @njit
 def integrals_summing(
     data: np.ndarray, windows: Tuple[np.ndarray], data_pkg: np.ndarray = None
@@ -299,20 +341,18 @@ def integrals_summing(
 
     :return: integrals for data, integrals for data_pkg
     """
-    integrals = np.zeros((len(windows), 2))
-
     # packages
     integrals_pkg = None
     if data_pkg is not None:
-        integrals_pkg = np.zeros((data_pkg.shape[0], len(windows), 2))
+        integrals_pkg = np.empty((data_pkg.shape[0], len(windows), 2))
         for ht in range(len(data_pkg)):
             for it, window in enumerate(windows):
                 integrals_pkg[ht][it][0] = data_pkg[ht][window].sum()
                 integrals_pkg[ht][it][1] = np.sqrt(integrals_pkg[ht][it][0])
         # define all integrals as the sum of the packages -> allow for filtering
-        integrals[:, 0] = integrals_pkg.sum(axis=0)[:, 0]
-        integrals[:, 1] = np.sqrt(np.sum(integrals_pkg[:, :, 1] ** 2, axis=0))
+        integrals = integrals_pkg_sum(integrals_pkg)
     else:
+        integrals = np.empty((len(windows), 2))
         for it, window in enumerate(windows):
             integrals[it][0] = data[window].sum()
             integrals[it][1] = np.sqrt(integrals[it][0])
@@ -423,18 +463,20 @@ def mass_calibration(
     t0 = (ch1 * np.sqrt(m2) - ch2 * np.sqrt(m1)) / (np.sqrt(m2) - np.sqrt(m1))
     b = np.sqrt((ch1 - t0) ** 2.0 / m1)
 
-    # fit the curve and store the parameters
-    with warnings.catch_warnings():
-        if rimseval.VERBOSITY < 2:
-            warnings.simplefilter("ignore", category=RuntimeWarning)
-        params_fit = optimize.curve_fit(
-            calc_mass, params[:, 0], params[:, 1], p0=(t0, b)
-        )
+    if len(params) == 2:  # the initial guess already solves the calibration exactly
+        params_fit = np.array([t0, b])
+    else:  # fit the curve and store the parameters
+        with warnings.catch_warnings():
+            if rimseval.VERBOSITY < 2:
+                warnings.simplefilter("ignore", category=RuntimeWarning)
+            params_fit = optimize.curve_fit(
+                calc_mass, params[:, 0], params[:, 1], p0=(t0, b)
+            )[0]
 
-    mass = calc_mass(tof, params_fit[0][0], params_fit[0][1])
+    mass = calc_mass(tof, params_fit[0], params_fit[1])
 
     if return_params:
-        return mass, params_fit[0]
+        return mass, params_fit
     else:
         return mass
 
@@ -675,6 +717,8 @@ def sort_backgrounds(
     :return: Sorted background definition.
     """
     names, values = def_backgrounds
+    if len(names) < 2:  # nothing to sort
+        return names, values
 
     zz = []  # number of protons per isotope - first sort key
     for name in names:
@@ -690,9 +734,8 @@ def sort_backgrounds(
         except IndexError:
             mass.append(999)
 
-    sort_ind = sorted(
-        np.arange(len(names)), key=lambda x: (zz[x], mass[x], values[x, 0])
-    )
+    # last key is the primary sort key
+    sort_ind = np.lexsort((values[:, 0], mass, zz))
 
     if (sort_ind == np.arange(len(names))).all():  # already sorted
         return names, values
@@ -713,6 +756,8 @@ def sort_integrals(
     :return: Sorted integral definition, sorting array (None if already sorted).
     """
     names, values = def_integrals
+    if len(names) < 2:  # nothing to sort
+        return (names, values), None
 
     zz = []  # number of protons per isotope - first sort key
     for name in names:
@@ -721,7 +766,7 @@ def sort_integrals(
         except IndexError:
             zz.append(999)  # at the end of everything
 
-    sort_ind = sorted(np.arange(len(names)), key=lambda x: (zz[x], values[x, 0]))
+    sort_ind = np.lexsort((values[:, 0], zz))  # last key is the primary sort key
 
     if (sort_ind == np.arange(len(names))).all():  # already sorted
         return (names, values), None
@@ -736,16 +781,21 @@ def sort_data_into_spectrum(
 ) -> np.ndarray:  # pragma: nocover
     """Sort ion data in 1D array into an overall array and sum them up.
 
+    The ions are kept as a list of arrival bins and only histogrammed here, when
+    a spectrum is requested.
+
     :param ions: Arrival time of the ions - number of time bin
     :param bin_start: First bin of spectrum
     :param bin_end: Last bin of spectrum
 
     :return: arrival bins summed up
     """
-    data = np.zeros(bin_end - bin_start + 1)
-    for ion in ions:
-        data[ion - bin_start] += 1
-    return data
+    nof_bins = bin_end - bin_start + 1
+    if bin_start == 0:  # no need to shift, avoids a temporary copy of all ions
+        data = np.bincount(ions, minlength=nof_bins)
+    else:
+        data = np.bincount(ions - bin_start, minlength=nof_bins)
+    return data[:nof_bins].astype(np.float64)
 
 
 def tof_to_mass(
@@ -16,10 +16,10 @@ def mpa4a_data_ascii():
     contains data.
 
     :return: A tuple with channel, format, and data
-    :rtype: (int, DataFormat, list)
+    :rtype: (int, ASCIIFormat, list)
     """
     channel = 4
-    fmt = rimseval.lst_processor.LST2CRD.ASCIIFormat.ASCII_1A
+    fmt = rimseval.data_io.LST2CRD.ASCIIFormat.ASC_1A
     data = [
         "000200b95a54",
         "000300b95a54",
@@ -1,13 +1,64 @@
 """Tests for processors utilities."""
 
+import struct
+
 import numpy as np
 
 import rimseval.data_io.crd_utils as cu
 
 
+def test_find_shot_headers():
+    """Find the ions per shot entries in a CRD data block."""
+    words = np.array([2, 100, 101, 0, 1, 200], dtype=np.uint32)
+    indexes_exp = np.array([0, 3, 4])
+    indexes_rec, end_rec = cu.find_shot_headers(words, 3)
+    np.testing.assert_equal(indexes_rec, indexes_exp)
+    assert end_rec == words.shape[0]
+
+
+def test_find_shot_headers_data_too_short():
+    """Stop looking for shots when the data block ends early."""
+    words = np.array([2, 100, 101, 3, 200], dtype=np.uint32)
+    indexes_rec, end_rec = cu.find_shot_headers(words, 5)
+    np.testing.assert_equal(indexes_rec, np.array([0, 3]))
+    assert end_rec > words.shape[0]
+
+
+def test_parse_data_fallback():
+    """Parse a data block shot by shot until it ends."""
+    words = np.array([2, 100, 101, 0, 1, 200, 1, 300], dtype=np.uint32)
+    ions_per_shot_rec, all_tofs_rec = cu.parse_data_fallback(words)
+    np.testing.assert_equal(ions_per_shot_rec, np.array([2, 0, 1, 1]))
+    np.testing.assert_equal(all_tofs_rec, np.array([100, 101, 200, 300]))
+
+
+def test_parse_data_fallback_truncated():
+    """Truncate the last shot if it claims more ions than data is available."""
+    words = np.array([1, 100, 3, 200], dtype=np.uint32)
+    ions_per_shot_rec, all_tofs_rec = cu.parse_data_fallback(words)
+    np.testing.assert_equal(ions_per_shot_rec, np.array([1, 1]))
+    np.testing.assert_equal(all_tofs_rec, np.array([100, 200]))
+
+
 def test_shot_to_tof_mapper():
     """Map ions per shot to all_tofs array."""
     ions_per_shot = np.array([0, 0, 3, 5, 0, 7])
     mapper_exp = np.array([[0, 0], [0, 0], [0, 3], [3, 8], [8, 8], [8, 15]])
     mapper_rec = cu.shot_to_tof_mapper(ions_per_shot)
     np.testing.assert_equal(mapper_rec, mapper_exp)
+
+
+def test_unpack_header():
+    """Unpack the start of a CRD header, keeping padding bytes of strings."""
+    hdr_exp = {
+        "fileID": b"CRD\0",
+        "startDateTime": b"2021:07:10 11:41:13\0",
+        "minVer": 0,
+        "majVer": 1,
+        "sizeOfHeaders": 88,
+    }
+    data = b"".join(
+        struct.pack(fmt, hdr_exp[name]) for name, _, fmt in cu.HEADER_START
+    )
+    hdr_rec = cu.unpack_header(data, cu.HEADER_START_DTYPE)
+    assert hdr_rec == hdr_exp
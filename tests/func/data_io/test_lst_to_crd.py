@@ -2,6 +2,7 @@
 
 from pathlib import Path
 
+import numpy as np
 import pytest
 
 # PROPERTIES #
@@ -14,6 +15,13 @@ def test_channel_data(init_lst_proc):
     assert init_lst_proc.channel_data == channel_number
 
 
+def test_channel_data_numpy_int(init_lst_proc):
+    """Store numpy integers as python integers for the data channel."""
+    init_lst_proc.channel_data = np.uint8(4)
+    assert init_lst_proc.channel_data == 4
+    assert type(init_lst_proc.channel_data) is int
+
+
 def test_channel_data_wrong_type(init_lst_proc):
     """Raise a type error when a wrong type is set for the channel number."""
     wrong_type = "42"
@@ -30,6 +38,13 @@ def test_channel_tag(init_lst_proc):
     assert init_lst_proc.channel_tag == channel_number
 
 
+def test_channel_tag_numpy_int(init_lst_proc):
+    """Store numpy integers as python integers for the tag channel."""
+    init_lst_proc.channel_tag = np.int64(3)
+    assert init_lst_proc.channel_tag == 3
+    assert type(init_lst_proc.channel_tag) is int
+
+
 def test_channel_tag_wrong_type(init_lst_proc):
     """Raise a type error when a wrong type is set for the channel number."""
     wrong_type = "42"
@@ -39,6 +54,15 @@ def test_channel_tag_wrong_type(init_lst_proc):
     assert exc_msg == "Channel number must be given as an integer."
 
 
+@pytest.mark.parametrize("fmt_bits", [("ASC_1A", 48, 16), ("ASC_9", 64, 20)])
+def test_ascii_format_bits(init_lst_proc, fmt_bits):
+    """Get binary width and sweep bits of ASCII formats."""
+    name, binary_width, sweep_bits = fmt_bits
+    fmt = init_lst_proc.ASCIIFormat[name]
+    assert fmt.binary_width == binary_width
+    assert fmt.sweep_bits == sweep_bits
+
+
 def test_data_format_invalid(init_lst_proc):
     """Raise TypeError if an invalid data format is selected."""
     with pytest.raises(TypeError):
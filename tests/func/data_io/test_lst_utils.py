@@ -1,6 +1,7 @@
 """Test list file utilities."""
 
 import numpy as np
+import pytest
 
 import rimseval.data_io.lst_utils as utl
 
@@ -61,19 +62,40 @@ def test_ascii_to_ndarray_ascii_1a_no_tag_other_channel(init_lst_proc):
     assert other_channels_ret == other_channels_exp
 
 
-def test_get_sweep_time_ascii():
-    """Transfer binary number to base 10 int based on boundaries."""
-    bin_str = "1000101101"
-    sweep_boundaries = (0, 5)
-    time_boundaries = (5, 10)
-    sweep_exp = int(bin_str[sweep_boundaries[0] : sweep_boundaries[1]], 2)
-    time_exp = int(bin_str[time_boundaries[0] : time_boundaries[1]], 2)
+def test_ascii_to_ndarray_bytes(init_lst_proc):
+    """Convert ASCII_1A data given as bytes with Windows line endings."""
+    data = b"0001000e7474\r\n0002000e7473\r\n0003000e7474\r\n\r\n"
+    fmt = init_lst_proc.ASCIIFormat.ASC_1A
+    channel = 4
+    expected_return = np.array([[1, 59207], [3, 59207]], dtype=np.uint32)
 
-    sweep_ret, time_ret = utl.get_sweep_time_ascii(
-        bin_str, sweep_boundaries, time_boundaries
-    )
-    assert sweep_ret == sweep_exp
-    assert time_ret == time_exp
+    ret_data, ret_tag, other_channels = utl.ascii_to_ndarray(data, fmt, channel)
+    np.testing.assert_equal(ret_data, expected_return)
+    assert ret_tag is None
+    assert other_channels == [3]
+
+
+def test_hex_lines_to_uint64():
+    """Parse hexadecimal lines, skipping empty ones."""
+    data = b"00ff\r\n\nA0\n ffffffffffffffff"
+    expected = np.array([0xFF, 0xA0, 0xFFFFFFFFFFFFFFFF], dtype=np.uint64)
+    ret = utl.hex_lines_to_uint64(np.frombuffer(data, dtype=np.uint8))
+    np.testing.assert_equal(ret, expected)
+
+
+def test_hex_lines_to_uint64_invalid():
+    """Raise ValueError if data are not hexadecimal."""
+    data = np.frombuffer(b"00ff\n00fg\n", dtype=np.uint8)
+    with pytest.raises(ValueError):
+        utl.hex_lines_to_uint64(data)
+
+
+def test_interleave_shots_ions():
+    """Interleave shots and ions into the CRD data block."""
+    shots = np.array([2, 0, 1], dtype=np.uint32)
+    ions = np.array([10, 20, 30], dtype=np.uint32)
+    data_exp = np.array([2, 10, 20, 0, 1, 30], dtype=np.uint32)
+    np.testing.assert_equal(utl.interleave_shots_ions(shots, ions), data_exp)
 
 
 def test_separate_signal_with_tag():
@@ -90,6 +112,22 @@ def test_separate_signal_with_tag():
     np.testing.assert_equal(tagged_rec, tagged_exp)
 
 
+def test_split_channels():
+    """Split values into data, tag, and other channels."""
+    # 8 bit values: sweep (2 bit), time (4 bit), channel (2 bit)
+    values = np.array(
+        [0b01001101, 0b10010010, 0b11000011, 0b01111110, 0b00000000], dtype=np.uint64
+    )
+    shifts = np.array([6, 2, 0], dtype=np.uint64)
+    masks = np.array([0b11, 0b1111, 0b11], dtype=np.uint64)
+
+    data_ret, tag_ret, other_ret = utl.split_channels(values, shifts, masks, 1, 2)
+
+    np.testing.assert_equal(data_ret, np.array([[1, 3]], dtype=np.uint32))
+    np.testing.assert_equal(tag_ret, np.array([2, 1], dtype=np.uint32))
+    np.testing.assert_equal(other_ret, np.array([3]))
+
+
 def test_transfer_lst_to_crd_data():
     """Transfer list data to CRD data."""
     max_sweep = 1023
@@ -128,6 +166,7 @@ def test_transfer_lst_to_crd_data():
         [500, 600, 265, 700, 55, 2, 50, 200, 13, 100], dtype=np.uint32
     )
 
+    data_in_copy = data_in.copy()
     shots_array_ret, ions_array_ret, out_of_range = utl.transfer_lst_to_crd_data(
         data_in, max_sweep, ion_range
     )
@@ -135,3 +174,11 @@ def test_transfer_lst_to_crd_data():
     np.testing.assert_equal(shots_array_ret, shots_array_exp)
     np.testing.assert_equal(ions_array_ret, ions_array_exp)
     assert out_of_range  # some ions are above ion range
+    np.testing.assert_equal(data_in, data_in_copy)  # input is not modified
+
+
+def test_transfer_lst_to_crd_data_empty():
+    """Raise ValueError if there are no data to transfer."""
+    data_in = np.empty((0, 2), dtype=np.uint32)
+    with pytest.raises(ValueError):
+        utl.transfer_lst_to_crd_data(data_in, 1023, 1000)
@@ -0,0 +1,20 @@
+"""Tests for the utility functions of the matplotlib canvas in GUIs."""
+
+import numpy as np
+
+from rimseval.guis import mpl_canvas
+
+
+def test_minmax_indexes():
+    """Decimate data into bins and keep the minimum and maximum of each bin."""
+    data = np.array([1, 5, 2, 0, 3, 3, 4, 9, 1, 2, 7])
+    ind_exp = np.array([0, 1, 3, 4, 7, 8, 9, 10])  # bins of 3, plus the rest
+
+    ind_rec = mpl_canvas._minmax_indexes(data, 4)
+    np.testing.assert_equal(ind_exp, ind_rec)
+
+
+def test_minmax_indexes_short():
+    """Return all indexes if there are not more than two points per bin."""
+    data = np.arange(8)
+    np.testing.assert_equal(mpl_canvas._minmax_indexes(data, 4), np.arange(8))
@@ -76,6 +76,38 @@ def test_delta_calc():
     assert np.isnan(deltas[2:3]).all()  # last two must be nans
 
 
+def test_delta_calc_stacked():
+    """Calculate delta values for stacked integrals, e.g., for packages."""
+    names = ["Fe54", "Fe56", "244Pu", "bg"]
+    integrals_pkg = np.array(
+        [
+            [[10000, 100], [100000, 240], [100, 10], [2001, 21]],
+            [[9000, 95], [110000, 250], [90, 9], [1900, 20]],
+        ]
+    )
+    deltas_pkg = pu.delta_calc(names, integrals_pkg)
+    assert deltas_pkg.shape == integrals_pkg.shape
+    for it, integrals in enumerate(integrals_pkg):
+        np.testing.assert_allclose(deltas_pkg[it], pu.delta_calc(names, integrals))
+
+
+def test_delta_calc_norm_isos_changed():
+    """Use the normalization isotopes that are set in iniabu at the time of calling."""
+    names = ["Ti46", "Ti47", "Ti48"]
+    integrals = np.array([[10000, 100], [10000, 100], [100000, 300]])
+    deltas_default = pu.delta_calc(names, integrals)
+    assert deltas_default[2, 0] == pytest.approx(0)  # Ti-48 is the default
+
+    pu.ini.norm_isos = {"Ti": "Ti-46"}
+    try:
+        deltas_ti46 = pu.delta_calc(names, integrals)
+    finally:
+        pu.ini.reset_norm_isos()
+    assert deltas_ti46[0, 0] == pytest.approx(0)
+    assert deltas_ti46[2, 0] == pytest.approx(pu.ini.iso_delta("Ti-48", "Ti-46", 10))
+    np.testing.assert_allclose(pu.delta_calc(names, integrals), deltas_default)
+
+
 def test_delta_calc_verbosity_warning():
     """Raise warning if VERBOSITY is >= 2 and division by zero occurs."""
     rimseval.VERBOSITY = 2
@@ -195,6 +227,14 @@ def test_integrals_bg_corr_pkg():
     assert len(integrals_pkg_rec) == 1
 
 
+def test_integrals_pkg_sum():
+    """Sum integrals of packages and add uncertainties in quadrature."""
+    integrals_pkg = np.array([[[100.0, 10.0], [16.0, 4.0]], [[44.0, 5.0], [9.0, 3.0]]])
+    integrals_exp = np.array([[144.0, np.sqrt(125.0)], [25.0, 5.0]])
+    integrals_rec = pu.integrals_pkg_sum(integrals_pkg)
+    np.testing.assert_almost_equal(integrals_rec, integrals_exp)
+
+
 def test_integrals_summing():
     """Sum integrals for given data."""
     data = np.arange(100) * 2  # *2 such that index not equal to value
@@ -269,6 +309,16 @@ def test_mass_calibration(mocker):
     mock.assert_not_called()
 
 
+def test_mass_calibration_two_points():
+    """Two calibration points are solved exactly."""
+    params = np.array([[2.5, 12.0], [5.0, 56.0]])
+
+    mass, params_fit = pu.mass_calibration(params, params[:, 0], return_params=True)
+
+    np.testing.assert_allclose(mass, params[:, 1])
+    np.testing.assert_allclose(pu.mass_to_tof(params[:, 1], *params_fit), params[:, 0])
+
+
 def test_mass_to_tof():
     """Convert mass to time of flight."""
     m = 42.0
@@ -407,3 +457,11 @@ def test_sort_data_into_spectrum():
         spectrum_exp[ion] += 1
     spectrum_rec = pu.sort_data_into_spectrum(ions, ions.min(), ions.max())
     np.testing.assert_equal(spectrum_rec, spectrum_exp)
+
+
+def test_sort_data_into_spectrum_shifted():
+    """Sort data into a spectrum that does not start at bin zero."""
+    ions = np.array([3, 4, 8, 3])
+    spectrum_exp = np.array([2, 1, 0, 0, 0, 1], dtype=float)
+    spectrum_rec = pu.sort_data_into_spectrum(ions, 3, 8)
+    np.testing.assert_equal(spectrum_rec, spectrum_exp)
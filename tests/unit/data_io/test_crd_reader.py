@@ -1,10 +1,12 @@
 """Unit tests for the CRD reader, making use of the `crd_file` fixture."""
 
+import os
 from pathlib import Path
 
 import numpy as np
 import pytest
 
+from rimseval.data_io import crd_reader
 from rimseval.data_io.crd_reader import CRDReader
 from ...utils import assert_crd_equal
 
@@ -65,6 +67,48 @@ def test_crd_nof_shots(crd_file):
     assert crd.nof_shots == hdr["nofShots"]
 
 
+def test_crd_cache(crd_file):
+    """Write a cache on first read and read identical data from it afterwards."""
+    hdr, _, _, fname = crd_file
+    fname = Path(fname)
+    crd = CRDReader(fname, cache=True)
+    cache_fname = fname.with_name(f"{fname.name}.npz")
+    assert cache_fname.is_file()
+
+    crd_reader._CRD_CACHE.clear()  # force reading from the cache file
+    crd_cached = CRDReader(fname, cache=True)
+    assert crd_cached.header == hdr
+    assert crd_cached.eof
+    assert_crd_equal(crd, crd_cached)
+
+
+def test_crd_cache_outdated(crd_file):
+    """Ignore the cache if the CRD file was modified after writing it."""
+    _, _, _, fname = crd_file
+    fname = Path(fname)
+    cache_fname = fname.with_name(f"{fname.name}.npz")
+    cache_fname.write_bytes(b"not a cache")
+    os.utime(cache_fname, (0, 0))
+
+    crd = CRDReader(fname, cache=True)
+    assert_crd_equal(crd, CRDReader(fname))
+    assert cache_fname.stat().st_mtime >= fname.stat().st_mtime
+
+
+def test_crd_reader_shared(crd_file):
+    """Return the same reader if the file is opened again without modification."""
+    _, _, _, fname = crd_file
+    fname = Path(fname)
+    crd = CRDReader(fname)
+    assert CRDReader(fname) is crd
+
+    stat = fname.stat()
+    os.utime(fname, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+    crd_new = CRDReader(fname)
+    assert crd_new is not crd
+    assert_crd_equal(crd, crd_new)
+
+
 # ERROR CHECKING #
 
 
@@ -147,3 +147,27 @@ def test_no_data_type_error(lst_crd_path):
 
     msg = err.value.args[-1]
     assert err_msg_exp in msg
+
+
+def test_no_data_block_error(tmpdir, lst_crd_path):
+    """Raise OSError if file contains no data block."""
+    lst_fname = "MCS8a_short_10k_signal.lst"
+    content = lst_crd_path.joinpath(lst_fname).read_bytes()
+    tmpdir.join(lst_fname).write_binary(content.replace(b"[DATA]", b"[NODATA]"))
+    lst_fpath = Path(tmpdir.strpath).joinpath(lst_fname)
+
+    conv = LST2CRD(lst_fpath, channel_data=9)
+    with pytest.raises(OSError, match="Could not find the data block"):
+        conv.read_list_file()
+
+
+def test_no_calfact_error(tmpdir, lst_crd_path):
+    """Raise OSError if file contains a range but no calibration factor."""
+    lst_fname = "MCS8a_short_10k_signal.lst"
+    content = lst_crd_path.joinpath(lst_fname).read_bytes()
+    tmpdir.join(lst_fname).write_binary(content.replace(b"calfact=", b"calfac="))
+    lst_fpath = Path(tmpdir.strpath).joinpath(lst_fname)
+
+    conv = LST2CRD(lst_fpath, channel_data=9)
+    with pytest.raises(OSError, match="Could not find a calibration factor"):
+        conv.read_list_file()
@@ -110,6 +110,30 @@ def test_calfile_save_reapply_filters(legacy_files_path, crd_file, tmpdir):
     assert crd_1.applied_filters == crd_2.applied_filters
 
 
+def test_calfile_save_reapply_filters_numpy_scalars(crd_file, tmpdir):
+    """Save filters that were set with numpy scalars and load them again."""
+    _, _, _, fname = crd_file
+
+    crd_1 = CRDFileProcessor(Path(fname))
+    crd_1.applied_filters = {
+        "dead_time_corr": [True, np.int64(8)],
+        "max_ions_per_time": [True, 11, np.float64(100.25)],
+        "max_ions_per_tof_window": [False, 11, [np.float64(10.125), np.nan]],
+    }
+
+    settings_file = Path(tmpdir.join("settings.json"))
+    interfacer.save_cal_file(crd_1, settings_file)
+    assert settings_file.read_text(encoding="utf-8").startswith('{\n    "')
+
+    crd_2 = CRDFileProcessor(Path(fname))
+    interfacer.load_cal_file(crd_2, settings_file)
+
+    assert crd_2.applied_filters["dead_time_corr"] == [True, 8]
+    assert crd_2.applied_filters["max_ions_per_time"] == [True, 11, 100.25]
+    assert crd_2.applied_filters["max_ions_per_tof_window"][2][0] == 10.125
+    assert np.isnan(crd_2.applied_filters["max_ions_per_tof_window"][2][1])
+
+
 def test_calfile_save_reapply_mcal_only(legacy_files_path, crd_file, tmpdir):
     """Save a mass calibration to default, reload again, and ensure it works."""
     _, _, _, fname = crd_file